@@ -8,6 +8,9 @@ Responsible for:
 """
 import logging
 
+import aiohttp
+
+from custom_components.pajgps.const import ALERT_TYPE_FIELDS
 from custom_components.pajgps.requests import make_request, ApiResponseError
 from custom_components.pajgps.models import PajGPSAlert, PajGPSDevice
 
@@ -15,20 +18,8 @@ _LOGGER = logging.getLogger(__name__)
 
 API_URL = "https://connect.paj-gps.de/api/v1/"
 
-# Maps alert_type int → (field_name_on_device, attribute_name_on_PajGPSDevice)
-_ALERT_TYPE_MAP: dict[int, tuple[str, str]] = {
-    1:  ("alarmbewegung",          "alarm_shock_enabled"),
-    2:  ("alarmakkuwarnung",       "alarm_battery_enabled"),
-    4:  ("alarmsos",               "alarm_sos_enabled"),
-    5:  ("alarmgeschwindigkeit",   "alarm_speed_enabled"),
-    6:  ("alarmstromunterbrechung","alarm_power_cutoff_enabled"),
-    7:  ("alarmzuendalarm",        "alarm_ignition_enabled"),
-    9:  ("alarm_fall",             "alarm_drop_enabled"),
-    13: ("alarm_volt",             "alarm_voltage_enabled"),
-}
-
 
-async def fetch_alerts(headers: dict) -> tuple[list[PajGPSAlert], dict | None]:
+async def fetch_alerts(headers: dict, session: aiohttp.ClientSession | None = None) -> tuple[list[PajGPSAlert], dict | None]:
     """
     Fetch all unread alerts from the PajGPS API.
 
@@ -42,7 +33,7 @@ async def fetch_alerts(headers: dict) -> tuple[list[PajGPSAlert], dict | None]:
     params = {"isRead": 0}
     raw_json = None
     try:
-        raw_json = await make_request("GET", url, headers, params=params)
+        raw_json = await make_request("GET", url, headers, params=params, session=session)
     except ApiResponseError as e:
         _LOGGER.error("Error while getting alerts data: %s", e)
         return [], None
@@ -60,7 +51,7 @@ async def fetch_alerts(headers: dict) -> tuple[list[PajGPSAlert], dict | None]:
     return alerts, raw_json
 
 
-async def consume_alerts(alert_ids: list[int], headers: dict) -> None:
+async def consume_alerts(alert_ids: list[int], headers: dict, session: aiohttp.ClientSession | None = None) -> None:
     """
     Mark the given alert types as read in the PajGPS API.
 
@@ -72,7 +63,7 @@ async def consume_alerts(alert_ids: list[int], headers: dict) -> None:
     for alert_id in alert_ids:
         params = {"alertType": alert_id, "isRead": 1}
         try:
-            await make_request("PUT", url, headers, params=params)
+            await make_request("PUT", url, headers, params=params, session=session)
             _LOGGER.debug("Alert %s marked as read", alert_id)
         except ApiResponseError as e:
             _LOGGER.error("Error while marking alert %s as read: %s", alert_id, e)
@@ -85,6 +76,7 @@ async def change_alert_state(
     alert_type: int,
     state: bool,
     headers: dict,
+    session: aiohttp.ClientSession | None = None,
 ) -> None:
     """
     Enable or disable a specific alert type for a device via the PajGPS API.
@@ -96,18 +88,19 @@ async def change_alert_state(
     curl -X 'PUT' 'https://connect.paj-gps.de/api/v1/device/<DeviceID>' \
          -d '{"alarmsos": 1}'
     """
-    if alert_type not in _ALERT_TYPE_MAP:
+    fields = ALERT_TYPE_FIELDS.get(alert_type)
+    if fields is None:
         _LOGGER.error("Unknown alert type: %s", alert_type)
         return
 
-    alert_name, device_attr = _ALERT_TYPE_MAP[alert_type]
+    _, device_attr, alert_name = fields
     setattr(device, device_attr, state)
 
     state_int = 1 if state else 0
     url = API_URL + "device/" + str(device.id)
     params = {alert_name: state_int}
     try:
-        await make_request("PUT", url, headers, params=params)
+        await make_request("PUT", url, headers, params=params, session=session)
         _LOGGER.debug("Alert %s for device %s set to %s", alert_name, device.id, state_int)
     except ApiResponseError as e:
         _LOGGER.error("Error while changing alert state: %s", e)
@@ -9,6 +9,8 @@ Responsible for:
 import logging
 import time
 
+import aiohttp
+
 from custom_components.pajgps.requests import make_request, ApiResponseError
 
 _LOGGER = logging.getLogger(__name__)
@@ -32,7 +34,7 @@ class LoginResponse:
         return f"token: {self.token}, userID: {self.userID}, routeIcon: {self.routeIcon}"
 
 
-async def get_login_token(email: str, password: str) -> str | None:
+async def get_login_token(email: str, password: str, session: aiohttp.ClientSession | None = None) -> str | None:
     """
     Obtain a login token from the PajGPS API.
 
@@ -56,7 +58,7 @@ async def get_login_token(email: str, password: str) -> str | None:
         "password": password,
     }
     try:
-        json_response = await make_request("POST", url, headers, params=params)
+        json_response = await make_request("POST", url, headers, params=params, session=session)
         login_response = LoginResponse(json_response)
         return login_response.token
     except ApiResponseError as e:
@@ -74,6 +76,7 @@ async def refresh_token(
     email: str,
     password: str,
     forced: bool = False,
+    session: aiohttp.ClientSession | None = None,
 ) -> tuple[str | None, float]:
     """
     Refresh the bearer token if it has expired or is missing.
@@ -92,7 +95,7 @@ async def refresh_token(
     _LOGGER.debug("Refreshing token")
     new_token: str | None = None
     try:
-        new_token = await get_login_token(email, password)
+        new_token = await get_login_token(email, password, session)
     except TimeoutError:
         _LOGGER.error("Timeout while getting login token")
 
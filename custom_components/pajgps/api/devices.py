@@ -7,6 +7,8 @@ Responsible for:
 """
 import logging
 
+import aiohttp
+
 from custom_components.pajgps.requests import make_request, ApiResponseError
 from custom_components.pajgps.models import PajGPSDevice
 
@@ -45,7 +47,7 @@ def _parse_device(device: dict) -> PajGPSDevice | None:
     return device_data
 
 
-async def fetch_devices(headers: dict) -> tuple[list[PajGPSDevice], dict | None]:
+async def fetch_devices(headers: dict, session: aiohttp.ClientSession | None = None) -> tuple[list[PajGPSDevice], dict | None]:
     """
     Fetch all devices from the PajGPS API.
 
@@ -58,7 +60,7 @@ async def fetch_devices(headers: dict) -> tuple[list[PajGPSDevice], dict | None]
     url = API_URL + "device"
     raw_json = None
     try:
-        raw_json = await make_request("GET", url, headers)
+        raw_json = await make_request("GET", url, headers, session=session)
     except ApiResponseError as e:
         _LOGGER.error("Error while getting devices data: %s", e)
         return [], None
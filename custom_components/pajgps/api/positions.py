@@ -8,6 +8,8 @@ Responsible for:
 """
 import logging
 
+import aiohttp
+
 from custom_components.pajgps.requests import make_request, ApiResponseError
 from custom_components.pajgps.models import PajGPSPositionData
 
@@ -17,7 +19,11 @@ API_URL = "https://connect.paj-gps.de/api/v1/"
 ELEVATION_API_URL = "https://api.open-meteo.com/v1/elevation"
 
 
-async def fetch_positions(device_ids: list[int], headers: dict) -> tuple[list[PajGPSPositionData], dict | None]:
+async def fetch_positions(
+    device_ids: list[int],
+    headers: dict,
+    session: aiohttp.ClientSession | None = None,
+) -> tuple[list[PajGPSPositionData], dict | None]:
     """
     Fetch the last known position for every device in device_ids.
 
@@ -33,7 +39,7 @@ async def fetch_positions(device_ids: list[int], headers: dict) -> tuple[list[Pa
     payload = {"deviceIDs": device_ids, "fromLastPoint": False}
     raw_json = None
     try:
-        raw_json = await make_request("POST", url, headers, payload=payload)
+        raw_json = await make_request("POST", url, headers, payload=payload, session=session)
     except ApiResponseError as e:
         _LOGGER.error("Error while getting tracking data: %s", e)
         return [], None
@@ -62,7 +68,11 @@ async def fetch_positions(device_ids: list[int], headers: dict) -> tuple[list[Pa
     return positions, raw_json
 
 
-async def fetch_elevation(device_id: int, position: PajGPSPositionData) -> float | None:
+async def fetch_elevation(
+    device_id: int,
+    position: PajGPSPositionData,
+    session: aiohttp.ClientSession | None = None,
+) -> float | None:
     """
     Fetch the elevation (in metres) for the given position from the Open-Meteo API.
 
@@ -80,7 +90,7 @@ async def fetch_elevation(device_id: int, position: PajGPSPositionData) -> float
 
     raw_json = None
     try:
-        raw_json = await make_request("GET", ELEVATION_API_URL, headers, params=params)
+        raw_json = await make_request("GET", ELEVATION_API_URL, headers, params=params, session=session)
     except TimeoutError:
         _LOGGER.warning(
             "Timeout while getting elevation data for device %s at (%s, %s)",
@@ -5,38 +5,52 @@ Responsible for:
 - Fetching voltage sensor data per device
 - Converting raw millivolt values to volts
 """
+import asyncio
 import logging
 
+import aiohttp
+
 from custom_components.pajgps.requests import make_request, ApiResponseError
 from custom_components.pajgps.models import PajGPSDevice, PajGPSSensorData
 
 _LOGGER = logging.getLogger(__name__)
 
 API_URL = "https://connect.paj-gps.de/api/v1/"
+MAX_CONCURRENT_REQUESTS = 8  # per-device sensor requests allowed in flight at once
 
 
-async def fetch_sensors(devices: list[PajGPSDevice], headers: dict) -> list[PajGPSSensorData]:
+async def fetch_sensors(
+    devices: list[PajGPSDevice],
+    headers: dict,
+    session: aiohttp.ClientSession | None = None,
+    concurrency: int = MAX_CONCURRENT_REQUESTS,
+) -> list[PajGPSSensorData]:
     """
     Fetch sensor data for every device in the supplied list.
 
+    The per-device requests are independent, so they are issued concurrently
+    and the total time is bound by the slowest device rather than the sum.
+    At most `concurrency` requests are in flight at once, so large accounts
+    do not hit the API with one request per device simultaneously.
+
     Returns a list of PajGPSSensorData, one entry per device.
     Voltage defaults to 0.0 on error or missing data.
 
     Corresponding CURL command:
     curl -X 'GET' 'https://connect.paj-gps.de/api/v1/sensordata/last/{DeviceID}'
     """
-    new_sensors = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_bounded(device_id: int) -> float:
+        async with semaphore:
+            return await _fetch_device_voltage(device_id, headers, session)
 
-    for device in devices:
-        sensor_data = PajGPSSensorData()
-        sensor_data.device_id = device.id
-        sensor_data.voltage = await _fetch_device_voltage(device.id, headers)
-        new_sensors.append(sensor_data)
+    voltages = await asyncio.gather(*(fetch_bounded(device.id) for device in devices))
 
-    return new_sensors
+    return [PajGPSSensorData(device.id, voltage) for device, voltage in zip(devices, voltages, strict=True)]
 
 
-async def _fetch_device_voltage(device_id: int, headers: dict) -> float:
+async def _fetch_device_voltage(device_id: int, headers: dict, session: aiohttp.ClientSession | None = None) -> float:
     """
     Fetch the voltage for a single device and convert millivolts → volts.
 
@@ -44,7 +58,7 @@ async def _fetch_device_voltage(device_id: int, headers: dict) -> float:
     """
     url = API_URL + f"sensordata/last/{device_id}"
     try:
-        raw_json = await make_request("GET", url, headers)
+        raw_json = await make_request("GET", url, headers, session=session)
     except ApiResponseError as e:
         _LOGGER.error("Error while getting sensor data for device %s: %s", device_id, e)
         return 0.0
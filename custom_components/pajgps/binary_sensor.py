@@ -6,16 +6,20 @@ and updating their state based on the data received from the Paj GPS API.
 from __future__ import annotations
 
 from datetime import timedelta
+from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import BinarySensorEntity, BinarySensorDeviceClass
 from homeassistant.core import HomeAssistant
 from homeassistant import config_entries
-from homeassistant.helpers.entity import DeviceInfo
 
-from custom_components.pajgps.const import DOMAIN, VERSION, ALERT_NAMES
+from custom_components.pajgps.const import ALERT_NAMES, ALERT_TYPE_TO_DEVICE_FIELD_ITEMS
 from custom_components.pajgps.pajgps_data import PajGPSData
 import logging
 
+if TYPE_CHECKING:
+    # Only used in annotations, which are lazy thanks to `from __future__ import annotations`
+    from homeassistant.helpers.entity import DeviceInfo
+
 _LOGGER = logging.getLogger(__name__)
 SCAN_INTERVAL = timedelta(seconds=30)
 
@@ -36,7 +40,7 @@ class PajGPSAlertSensor(BinarySensorEntity):
         self._alert_type = alert_type
         alert_name = ALERT_NAMES.get(alert_type, "Unknown Alert")
         self._device_name = f"{self._pajgps_data.get_device(device_id).name}"
-        self._attr_unique_id = f"pajgps_{self._pajgps_data.guid}_{self._device_id}_alert_{self._alert_type}"
+        self._attr_unique_id = f"{self._pajgps_data.unique_id_prefix}{self._device_id}_alert_{self._alert_type}"
         self._attr_name = f"{self._device_name} {alert_name}"
         self._attr_icon = "mdi:bell"
 
@@ -105,9 +109,7 @@ async def async_setup_entry(
     # Create main Paj GPS data object from pajgps_data.py
     pajgps_data = PajGPSData.get_instance(guid, entry_name, email, password, mark_alerts_as_read, fetch_elevation, force_battery)
 
-    # Update the data
-    await pajgps_data.update_pajgps_data()
-
+    # Data was already fetched by async_initialize_data before the platforms were forwarded
     # Add the Paj GPS alert sensors to the entity registry
     devices = pajgps_data.get_device_ids()
     if devices is not None:
@@ -116,22 +118,9 @@ async def async_setup_entry(
         for device_id in devices:
             device = pajgps_data.get_device(device_id)
             if device is not None:
-                if device.has_alarm_shock:
-                    entities.append(PajGPSAlertSensor(pajgps_data, device_id, 1))
-                if device.has_alarm_battery:
-                    entities.append(PajGPSAlertSensor(pajgps_data, device_id, 2))
-                if device.has_alarm_sos:
-                    entities.append(PajGPSAlertSensor(pajgps_data, device_id, 4))
-                if device.has_alarm_speed:
-                    entities.append(PajGPSAlertSensor(pajgps_data, device_id, 5))
-                if device.has_alarm_power_cutoff:
-                    entities.append(PajGPSAlertSensor(pajgps_data, device_id, 6))
-                if device.has_alarm_ignition:
-                    entities.append(PajGPSAlertSensor(pajgps_data, device_id, 7))
-                if device.has_alarm_drop:
-                    entities.append(PajGPSAlertSensor(pajgps_data, device_id, 9))
-                if device.has_alarm_voltage:
-                    entities.append(PajGPSAlertSensor(pajgps_data, device_id, 13))
+                for alert_type, field in ALERT_TYPE_TO_DEVICE_FIELD_ITEMS:
+                    if getattr(device, field):
+                        entities.append(PajGPSAlertSensor(pajgps_data, device_id, alert_type))
 
         if entities and async_add_entities:
             async_add_entities(entities, update_before_add=True)
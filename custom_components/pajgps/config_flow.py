@@ -10,7 +10,7 @@ from homeassistant import config_entries
 from homeassistant.core import callback
 
 from . import PajGPSData
-from .const import DOMAIN
+from .const import DOMAIN, ENTRY_DEFAULTS
 
 big_int = vol.All(vol.Coerce(int), vol.Range(min=300))
 # Email validator that checks if the string is not empty and contains '@'
@@ -19,12 +19,12 @@ email_validator = vol.All(cv.string, vol.Length(min=1), vol.Match(r"^[^@]+@[^@]+
 _LOGGER = logging.getLogger(__name__)
 CONFIG_SCHEMA = vol.Schema(
             {
-                vol.Required('entry_name', default='My Paj GPS Account'): cv.string,
-                vol.Required('email', default=''): cv.string,
-                vol.Required('password', default=''): cv.string,
-                vol.Required('mark_alerts_as_read', default=True): cv.boolean,
-                vol.Required('fetch_elevation', default=False): cv.boolean,
-                vol.Required('force_battery', default=False): cv.boolean,
+                vol.Required('entry_name', default=ENTRY_DEFAULTS['entry_name']): cv.string,
+                vol.Required('email', default=ENTRY_DEFAULTS['email']): cv.string,
+                vol.Required('password', default=ENTRY_DEFAULTS['password']): cv.string,
+                vol.Required('mark_alerts_as_read', default=ENTRY_DEFAULTS['mark_alerts_as_read']): cv.boolean,
+                vol.Required('fetch_elevation', default=ENTRY_DEFAULTS['fetch_elevation']): cv.boolean,
+                vol.Required('force_battery', default=ENTRY_DEFAULTS['force_battery']): cv.boolean,
             }
         )
 
@@ -34,9 +34,8 @@ class CustomFlow(config_entries.ConfigFlow, domain=DOMAIN):
     async def async_step_user(self, user_input: Optional[Dict[str, Any]] = None):
         errors: Dict[str, str] = {}
         if user_input is not None:
-            self.data = user_input
-            # Create new guid for the entry
-            self.data['guid'] = str(uuid.uuid4())
+            # Copy the input with a new guid for the entry, leaving the caller's dict untouched
+            self.data = {**user_input, 'guid': str(uuid.uuid4())}
             # If entry_name is null or empty string, add error
             if not self.data['entry_name'] or self.data['entry_name'] == '':
                 errors['base'] = 'entry_name_required'
@@ -68,37 +67,6 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
     ) -> Dict[str, Any]:
         errors: Dict[str, str] = {}
 
-        default_entry_name = ''
-        if 'entry_name' in self._config_entry.data:
-            default_entry_name = self._config_entry.data['entry_name']
-        if 'entry_name' in self._config_entry.options:
-            default_entry_name = self._config_entry.options['entry_name']
-        default_email = ''
-        if 'email' in self._config_entry.data:
-            default_email = self._config_entry.data['email']
-        if 'email' in self._config_entry.options:
-            default_email = self._config_entry.options['email']
-        default_password = ''
-        if 'password' in self._config_entry.data:
-            default_password = self._config_entry.data['password']
-        if 'password' in self._config_entry.options:
-            default_password = self._config_entry.options['password']
-        default_mark_alerts_as_read = True
-        if 'mark_alerts_as_read' in self._config_entry.data:
-            default_mark_alerts_as_read = self._config_entry.data['mark_alerts_as_read']
-        if 'mark_alerts_as_read' in self._config_entry.options:
-            default_mark_alerts_as_read = self._config_entry.options['mark_alerts_as_read']
-        default_fetch_elevation = False
-        if 'fetch_elevation' in self._config_entry.data:
-            default_fetch_elevation = self._config_entry.data['fetch_elevation']
-        if 'fetch_elevation' in self._config_entry.options:
-            default_fetch_elevation = self._config_entry.options['fetch_elevation']
-        default_force_battery = False
-        if 'force_battery' in self._config_entry.data:
-            default_force_battery = self._config_entry.data['force_battery']
-        if 'force_battery' in self._config_entry.options:
-            default_force_battery = self._config_entry.options['force_battery']
-
         if user_input is not None:
             # If email is null or empty string, add error
             if not user_input['email'] or user_input['email'] == '':
@@ -151,14 +119,18 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
 
 
+        # Options take precedence over the original entry data, looked up once for all defaults.
+        # entry_name keeps its empty fallback: an existing entry is not renamed to the new-entry default.
+        current = {**self._config_entry.data, **self._config_entry.options}
+
         OPTIONS_SCHEMA = vol.Schema(
             {
-                vol.Required('entry_name', default=default_entry_name): cv.string,
-                vol.Required('email', default=default_email): cv.string,
-                vol.Required('password', default=default_password): cv.string,
-                vol.Required('mark_alerts_as_read', default=default_mark_alerts_as_read): cv.boolean,
-                vol.Required('fetch_elevation', default=default_fetch_elevation): cv.boolean,
-                vol.Required('force_battery', default=default_force_battery): cv.boolean,
+                vol.Required('entry_name', default=current.get('entry_name', '')): cv.string,
+                vol.Required('email', default=current.get('email', ENTRY_DEFAULTS['email'])): cv.string,
+                vol.Required('password', default=current.get('password', ENTRY_DEFAULTS['password'])): cv.string,
+                vol.Required('mark_alerts_as_read', default=current.get('mark_alerts_as_read', ENTRY_DEFAULTS['mark_alerts_as_read'])): cv.boolean,
+                vol.Required('fetch_elevation', default=current.get('fetch_elevation', ENTRY_DEFAULTS['fetch_elevation'])): cv.boolean,
+                vol.Required('force_battery', default=current.get('force_battery', ENTRY_DEFAULTS['force_battery'])): cv.boolean,
             }
         )
         return self.async_show_form(step_id="init", data_schema=OPTIONS_SCHEMA, errors=errors)
@@ -1,7 +1,37 @@
+from types import MappingProxyType
+
 DOMAIN = "pajgps"
 VERSION = "0.7.0"
 
 ALERT_NAMES = {1: "Shock Alert", 2: "Battery Alert", 3: "Radius Alert", 4: "SOS Alert",
                5: "Speed Alert", 6: "Power Cut-off Alert", 7: "Ignition Alert",
                9: "Drop Alert", 10: "Area Enter Alert", 11: "Area Leave Alert",
-               13: "Voltage Alert", 22: "Turn off Alert"}
\ No newline at end of file
+               13: "Voltage Alert", 22: "Turn off Alert"}
+
+# Maps alert type → (PajGPSDevice support attribute, PajGPSDevice enabled attribute, API device field)
+# The single source for per-alert fields; add new alert types here only
+ALERT_TYPE_FIELDS = {
+    1:  ("has_alarm_shock",        "alarm_shock_enabled",        "alarmbewegung"),
+    2:  ("has_alarm_battery",      "alarm_battery_enabled",      "alarmakkuwarnung"),
+    4:  ("has_alarm_sos",          "alarm_sos_enabled",          "alarmsos"),
+    5:  ("has_alarm_speed",        "alarm_speed_enabled",        "alarmgeschwindigkeit"),
+    6:  ("has_alarm_power_cutoff", "alarm_power_cutoff_enabled", "alarmstromunterbrechung"),
+    7:  ("has_alarm_ignition",     "alarm_ignition_enabled",     "alarmzuendalarm"),
+    9:  ("has_alarm_drop",         "alarm_drop_enabled",         "alarm_fall"),
+    13: ("has_alarm_voltage",      "alarm_voltage_enabled",      "alarm_volt"),
+}
+
+# Maps alert type → PajGPSDevice attribute telling whether the model supports it
+ALERT_TYPE_TO_DEVICE_FIELD = {alert_type: fields[0] for alert_type, fields in ALERT_TYPE_FIELDS.items()}
+# The same pairs as a tuple, iterated by the per-device setup loops of switch and binary_sensor
+ALERT_TYPE_TO_DEVICE_FIELD_ITEMS = tuple(ALERT_TYPE_TO_DEVICE_FIELD.items())
+
+# Defaults for the config entry fields, shared by the config and options flows (read-only)
+ENTRY_DEFAULTS = MappingProxyType({
+    'entry_name': 'My Paj GPS Account',
+    'email': '',
+    'password': '',
+    'mark_alerts_as_read': True,
+    'fetch_elevation': False,
+    'force_battery': False,
+})
@@ -6,16 +6,19 @@ and updating their state based on the data received from the Paj GPS API.
 from __future__ import annotations
 
 from datetime import timedelta
+from typing import TYPE_CHECKING
 
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.core import HomeAssistant
 from homeassistant import config_entries
-from homeassistant.helpers.entity import DeviceInfo
 
-from custom_components.pajgps.const import DOMAIN, VERSION
 from custom_components.pajgps.pajgps_data import PajGPSData
 import logging
 
+if TYPE_CHECKING:
+    # Only used in annotations, which are lazy thanks to `from __future__ import annotations`
+    from homeassistant.helpers.entity import DeviceInfo
+
 _LOGGER = logging.getLogger(__name__)
 SCAN_INTERVAL = timedelta(seconds=30)
 
@@ -34,7 +37,7 @@ class PajGPSPositionSensor(TrackerEntity):
         self._pajgps_data = pajgps_data
         self._device_id = device_id
         self._device_name = f"{self._pajgps_data.get_device(device_id).name}"
-        self._attr_unique_id = f"pajgps_{self._pajgps_data.guid}_{self._device_id}_gps"
+        self._attr_unique_id = f"{self._pajgps_data.unique_id_prefix}{self._device_id}_gps"
         self._attr_name = f"{self._device_name} Location"
         self._attr_icon = "mdi:map-marker"
 
@@ -112,9 +115,7 @@ async def async_setup_entry(
     # Create main Paj GPS data object from pajgps_data.py
     pajgps_data = PajGPSData.get_instance(guid, entry_name, email, password, mark_alerts_as_read, fetch_elevation, force_battery)
 
-    # Update the data
-    await pajgps_data.update_pajgps_data()
-
+    # Data was already fetched by async_initialize_data before the platforms were forwarded
     # Add the Paj GPS position sensors to the entity registry
     devices = pajgps_data.get_device_ids()
     if devices is not None:
@@ -3,15 +3,31 @@ Domain models for the PajGPS integration.
 
 This module contains pure data classes representing PajGPS entities.
 These classes have no dependencies on HTTP, API logic, or Home Assistant internals.
+They declare __slots__: a fresh set of instances is built on every update, so
+dropping the per-instance __dict__ keeps them small and attribute access cheap.
 """
 import logging
 
+from custom_components.pajgps.const import ALERT_TYPE_FIELDS
+
 _LOGGER = logging.getLogger(__name__)
 
 
 class PajGPSDevice:
     """Representation of single Paj GPS device."""
 
+    __slots__ = (
+        "id", "name", "imei", "model", "has_battery",
+        "has_alarm_sos", "alarm_sos_enabled",
+        "has_alarm_shock", "alarm_shock_enabled",
+        "has_alarm_voltage", "alarm_voltage_enabled",
+        "has_alarm_battery", "alarm_battery_enabled",
+        "has_alarm_speed", "alarm_speed_enabled",
+        "has_alarm_power_cutoff", "alarm_power_cutoff_enabled",
+        "has_alarm_ignition", "alarm_ignition_enabled",
+        "has_alarm_drop", "alarm_drop_enabled",
+    )
+
     # Basic attributes
     id: int
     name: str
@@ -43,30 +59,19 @@ class PajGPSDevice:
 
     def is_alert_enabled(self, _alert_type) -> bool:
         """Check if the alert is available and enabled for the device."""
-        if _alert_type == 1:                 # Shock Alert
-            return self.has_alarm_shock and self.alarm_shock_enabled
-        elif _alert_type == 2:               # Battery Alert
-            return self.has_alarm_battery and self.alarm_battery_enabled
-        elif _alert_type == 4:               # SOS Alert
-            return self.has_alarm_sos and self.alarm_sos_enabled
-        elif _alert_type == 5:               # Speed Alert
-            return self.has_alarm_speed and self.alarm_speed_enabled
-        elif _alert_type == 6:               # Power Cutoff Alert
-            return self.has_alarm_power_cutoff and self.alarm_power_cutoff_enabled
-        elif _alert_type == 7:               # Ignition Alert
-            return self.has_alarm_ignition and self.alarm_ignition_enabled
-        elif _alert_type == 9:               # Drop Alert
-            return self.has_alarm_drop and self.alarm_drop_enabled
-        elif _alert_type == 13:              # Voltage Alert
-            return self.has_alarm_voltage and self.alarm_voltage_enabled
-        else:
+        fields = ALERT_TYPE_FIELDS.get(_alert_type)
+        if fields is None:
             _LOGGER.error("Unknown alert type: %s", _alert_type)
             return False
+        has_attr, enabled_attr, _ = fields
+        return getattr(self, has_attr) and getattr(self, enabled_attr)
 
 
 class PajGPSAlert:
     """Representation of single Paj GPS notification/alert."""
 
+    __slots__ = ("device_id", "alert_type")
+
     device_id: int
     alert_type: int
 
@@ -79,14 +84,16 @@ class PajGPSAlert:
 class PajGPSPositionData:
     """Representation of single Paj GPS device tracking data."""
 
+    __slots__ = ("device_id", "lat", "lng", "elevation", "direction", "speed", "battery_level", "last_elevation_update")
+
     device_id: int
     lat: float
     lng: float
-    elevation: float | None = None
+    elevation: float | None
     direction: int
     speed: int
     battery_level: int
-    last_elevation_update: float = 0.0
+    last_elevation_update: float
 
     def __init__(self, device_id: int, lat: float, lng: float, direction: int, speed: int, battery_level: int) -> None:
         """Initialize the PajGPSPositionData class."""
@@ -96,12 +103,22 @@ class PajGPSPositionData:
         self.direction = direction
         self.speed = speed
         self.battery_level = battery_level
+        self.elevation = None
+        self.last_elevation_update = 0.0
 
 
 class PajGPSSensorData:
     """Representation of single Paj GPS device sensor data."""
 
+    __slots__ = ("device_id", "voltage", "total_update_time_ms")
+
     device_id: int
-    voltage: float = 0.0
-    total_update_time_ms: float = 0.0   # Total time for full PajGPS data update in milliseconds
+    voltage: float
+    total_update_time_ms: float   # Total time for full PajGPS data update in milliseconds
+
+    def __init__(self, device_id: int, voltage: float = 0.0) -> None:
+        """Initialize the PajGPSSensorData class."""
+        self.device_id = device_id
+        self.voltage = voltage
+        self.total_update_time_ms = 0.0
 
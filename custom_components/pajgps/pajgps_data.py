@@ -8,6 +8,7 @@ instead of each sensor making its own API calls.
 import asyncio
 import logging
 import random
+import sys
 import time
 from datetime import timedelta
 import aiohttp
@@ -28,10 +29,12 @@ class PajGPSData:
     # Basic properties
     guid: str
     entry_name: str
+    unique_id_prefix: str  # "pajgps_{guid}_", shared by the unique_id of every entity
 
     # Session properties
     _session: aiohttp.ClientSession | None
     _background_tasks: set[asyncio.Task]
+    _inflight_elevation: set[int]  # device ids with an elevation fetch still running
 
     # Credentials properties
     email: str
@@ -39,6 +42,8 @@ class PajGPSData:
     token: str | None
     last_token_update: float
     token_ttl: int = 60 * 5  # 5 minutes
+    _cached_headers: dict | None
+    _cached_headers_token: str | None
 
     # Update properties
     last_update: float
@@ -55,10 +60,15 @@ class PajGPSData:
     positions_json: dict
 
     # Deserialized data
-    devices: list[models.PajGPSDevice]
+    _devices: list[models.PajGPSDevice]
     alerts: list[models.PajGPSAlert]
-    positions: list[models.PajGPSPositionData]
-    sensors: list[models.PajGPSSensorData]
+    _positions: list[models.PajGPSPositionData]
+    _sensors: list[models.PajGPSSensorData]
+
+    # Lookups by device id, rebuilt whenever the matching list above is replaced
+    _devices_by_id: dict[int, models.PajGPSDevice]
+    _positions_by_id: dict[int, models.PajGPSPositionData]
+    _sensors_by_id: dict[int, models.PajGPSSensorData]
 
 
     def __init__(self, guid: str, entry_name: str, email: str, password: str, mark_alerts_as_read: bool, fetch_elevation: bool, force_battery: bool) -> None:
@@ -67,6 +77,8 @@ class PajGPSData:
         """
 
         self.guid = guid
+        # The guid never changes for the lifetime of the entry, so build the prefix once
+        self.unique_id_prefix = sys.intern(f"pajgps_{guid}_")
         self.entry_name = entry_name
         self.email = email
         self.password = password
@@ -75,6 +87,7 @@ class PajGPSData:
         self.force_battery = force_battery
         self._session = None
         self._background_tasks = set()
+        self._inflight_elevation = set()
         self.update_lock = asyncio.Lock()
         self.devices = []
         self.alerts = []
@@ -82,6 +95,8 @@ class PajGPSData:
         self.sensors = []
         self.token = None
         self.last_token_update = 0.0
+        self._cached_headers = None
+        self._cached_headers_token = None
         self.last_update = time.time() - 60
         self.total_update_time_ms = 0.0
 
@@ -91,8 +106,7 @@ class PajGPSData:
         # Wait for any pending background tasks
         if self._background_tasks:
             _LOGGER.debug("Waiting for %s background tasks to complete", len(self._background_tasks))
-            await asyncio.gather(*self._background_tasks, return_exceptions=True)
-            self._background_tasks.clear()
+            await self.async_wait_idle()
 
         # Close the session
         if self._session and not self._session.closed:
@@ -102,6 +116,43 @@ class PajGPSData:
             self._session = None
             _LOGGER.debug("Session closed successfully")
 
+    async def async_wait_idle(self) -> None:
+        """
+        Wait until all background tasks (marking alerts as read, elevation fetches) have finished.
+        Exceptions from those tasks are not raised here.
+        """
+        # Loop in case a task was scheduled while waiting on the previous batch
+        while self._background_tasks:
+            await asyncio.gather(*self._background_tasks, return_exceptions=True)
+
+    @property
+    def devices(self) -> list[models.PajGPSDevice]:
+        return self._devices
+
+    @devices.setter
+    def devices(self, value: list[models.PajGPSDevice]) -> None:
+        # Entities look their device up by id on every update, so index the list once here
+        self._devices = value
+        self._devices_by_id = {device.id: device for device in value}
+
+    @property
+    def positions(self) -> list[models.PajGPSPositionData]:
+        return self._positions
+
+    @positions.setter
+    def positions(self, value: list[models.PajGPSPositionData]) -> None:
+        self._positions = value
+        self._positions_by_id = {position.device_id: position for position in value}
+
+    @property
+    def sensors(self) -> list[models.PajGPSSensorData]:
+        return self._sensors
+
+    @sensors.setter
+    def sensors(self, value: list[models.PajGPSSensorData]) -> None:
+        self._sensors = value
+        self._sensors_by_id = {sensor.device_id: sensor for sensor in value}
+
     @classmethod
     def get_instance(cls, guid: str, entry_name: str, email: str, password: str, mark_alerts_as_read: bool, fetch_elevation: bool, force_battery: bool) -> "PajGPSData":
         """
@@ -130,6 +181,7 @@ class PajGPSData:
             email=self.email,
             password=self.password,
             forced=forced,
+            session=self.get_session(),
         )
 
     def clean_data(self):
@@ -137,9 +189,27 @@ class PajGPSData:
         self.alerts = []
         self.positions = []
 
+    def get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the HTTP session shared by all API calls of this instance, creating it on first use.
+        Reusing one pooled session keeps connections and DNS lookups alive between updates
+        instead of paying a new TCP/TLS handshake for every request.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300, keepalive_timeout=75)
+            )
+        return self._session
+
     def get_standard_headers(self) -> dict:
-        """Get standard headers for API requests."""
-        return auth.get_standard_headers(self.token)
+        """
+        Get standard headers for API requests.
+        The headers only depend on the token, so they are built once per token and reused.
+        """
+        if self._cached_headers is None or self._cached_headers_token != self.token:
+            self._cached_headers = auth.get_standard_headers(self.token)
+            self._cached_headers_token = self.token
+        return self._cached_headers
 
 
     async def update_pajgps_data(self, forced: bool = False) -> None:
@@ -178,7 +248,7 @@ class PajGPSData:
 
     async def _is_infrastructure_ready(self) -> bool:
         """Ensure the API is reachable and the auth token is valid."""
-        if not await requests.check_pajgps_availability():
+        if not await requests.check_pajgps_availability(session=self.get_session()):
             _LOGGER.warning("API is not reachable, skipping update")
             return False
         await self.refresh_token()
@@ -212,10 +282,7 @@ class PajGPSData:
 
     def get_device(self, device_id: int) -> models.PajGPSDevice | None:
         """Get device by id."""
-        for device in self.devices:
-            if device.id == device_id:
-                return device
-        return None
+        return self._devices_by_id.get(device_id)
 
     def get_device_ids(self) -> list[int]:
         """Get device ids."""
@@ -223,32 +290,26 @@ class PajGPSData:
 
     def get_device_info(self, device_id: int) -> dict | None:
         """Get device info by id."""
-        for device in self.devices:
-            if device.id == device_id:
-                return {
-                    "identifiers": {
-                        (DOMAIN, f"{self.guid}_{device.id}")
-                    },
-                    "name": f"{device.name}",
-                    "manufacturer": "PAJ GPS",
-                    "model": device.model,
-                    "sw_version": VERSION,
-                }
-        return None
+        device = self._devices_by_id.get(device_id)
+        if device is None:
+            return None
+        return {
+            "identifiers": {
+                (DOMAIN, f"{self.guid}_{device.id}")
+            },
+            "name": f"{device.name}",
+            "manufacturer": "PAJ GPS",
+            "model": device.model,
+            "sw_version": VERSION,
+        }
 
     def get_position(self, device_id: int) -> models.PajGPSPositionData | None:
         """Get position data by device id."""
-        for position in self.positions:
-            if position.device_id == device_id:
-                return position
-        return None
+        return self._positions_by_id.get(device_id)
 
     def get_sensors(self, device_id: int) -> models.PajGPSSensorData | None:
         """Get sensor data by device id."""
-        for sensor in self.sensors:
-            if sensor.device_id == device_id:
-                return sensor
-        return None
+        return self._sensors_by_id.get(device_id)
 
     def get_alerts(self, device_id: int) -> list[models.PajGPSAlert]:
         """Get alerts by device id."""
@@ -257,7 +318,7 @@ class PajGPSData:
     async def update_position_data(self) -> None:
         """Fetch last positions for all devices and schedule elevation updates for moved devices."""
         new_positions, raw_json = await positions.fetch_positions(
-            self.get_device_ids(), self.get_standard_headers()
+            self.get_device_ids(), self.get_standard_headers(), self.get_session()
         )
 
         if raw_json is None:
@@ -268,24 +329,34 @@ class PajGPSData:
 
         if self.fetch_elevation:
             moved_ids = positions.find_moved_device_ids(new_positions, self.positions)
+            # Index the new snapshot once instead of scanning it for every moved device
+            old_by_id = self._positions_by_id
+            new_by_id = {p.device_id: p for p in new_positions}
+            now = time.time()
             for device_id in moved_ids:
-                old = self.get_position(device_id)
-                if old is not None and (time.time() - old.last_elevation_update) <= MIN_ELEVATION_UPDATE_DELAY:
+                if device_id in self._inflight_elevation:
+                    continue
+                old = old_by_id.get(device_id)
+                if old is not None and (now - old.last_elevation_update) <= MIN_ELEVATION_UPDATE_DELAY:
                     continue
-                new_pos = next((p for p in new_positions if p.device_id == device_id), None)
+                new_pos = new_by_id.get(device_id)
                 if new_pos is None:
                     continue
                 if old is not None:
-                    old.last_elevation_update = time.time()
+                    old.last_elevation_update = now
+                # Claimed before the task starts, so an overlapping update cannot schedule it again.
+                # Released from a done callback, which also runs if the task is cancelled before it starts.
+                self._inflight_elevation.add(device_id)
                 task = asyncio.create_task(self._update_elevation_for(device_id, new_pos))
                 self._background_tasks.add(task)
                 task.add_done_callback(self._background_tasks.discard)
+                task.add_done_callback(lambda _task, device_id=device_id: self._inflight_elevation.discard(device_id))
 
         self.positions = new_positions
 
     async def _update_elevation_for(self, device_id: int, position: models.PajGPSPositionData) -> None:
         """Fetch elevation for a single position and store the result."""
-        elevation = await positions.fetch_elevation(device_id, position)
+        elevation = await positions.fetch_elevation(device_id, position, self.get_session())
         if elevation is None:
             _LOGGER.warning("Failed to fetch elevation for device %s, keeping previous elevation if any", device_id)
             return
@@ -299,7 +370,7 @@ class PajGPSData:
 
     async def update_devices_data(self) -> None:
         """Fetch device list from the API and update self.devices."""
-        new_devices, raw_json = await devices.fetch_devices(self.get_standard_headers())
+        new_devices, raw_json = await devices.fetch_devices(self.get_standard_headers(), self.get_session())
         if raw_json is not None:
             self.devices_json = raw_json
         if new_devices:
@@ -309,7 +380,7 @@ class PajGPSData:
 
     async def update_sensors_data(self) -> None:
         """Fetch sensor data for all known devices and update self.sensors."""
-        new_sensors = await sensors.fetch_sensors(self.devices, self.get_standard_headers())
+        new_sensors = await sensors.fetch_sensors(self.devices, self.get_standard_headers(), self.get_session())
         if new_sensors:
             self.sensors = new_sensors
         else:
@@ -317,7 +388,7 @@ class PajGPSData:
 
     async def update_alerts_data(self) -> None:
         """Fetch unread alerts and optionally schedule marking them as read."""
-        new_alerts, raw_json = await alerts.fetch_alerts(self.get_standard_headers())
+        new_alerts, raw_json = await alerts.fetch_alerts(self.get_standard_headers(), self.get_session())
 
         if raw_json is None:
             _LOGGER.warning("Keeping stale alert data due to fetch error")
@@ -334,7 +405,7 @@ class PajGPSData:
 
     async def consume_alerts(self, alert_ids: list[int]) -> None:
         """Mark the given alert types as read in the API."""
-        await alerts.consume_alerts(alert_ids, self.get_standard_headers())
+        await alerts.consume_alerts(alert_ids, self.get_standard_headers(), self.get_session())
 
     async def change_alert_state(self, device_id: int, alert_type: int, state: bool) -> None:
         """Enable or disable an alert type for a device."""
@@ -342,4 +413,4 @@ class PajGPSData:
         if device is None:
             _LOGGER.error("Device not found: %s", device_id)
             return
-        await alerts.change_alert_state(device, alert_type, state, self.get_standard_headers())
+        await alerts.change_alert_state(device, alert_type, state, self.get_standard_headers(), self.get_session())
@@ -16,33 +16,42 @@ REQUEST_ATTEMPTS = 3  # maximum number of retry attempts
 
 class ApiResponseError(Exception):
     """Exception raised when API returns an error response."""
-    def __init__(self, error_json: dict):
+    def __init__(self, error_json: dict, status: int | None = None):
         self.error_json = error_json
-        super().__init__(f"API Error: {error_json}")
+        self.status = status
+        # The status is kept in the message so logged errors show e.g. a 429 the same way as non-JSON ones
+        if status is None:
+            super().__init__(f"API Error: {error_json}")
+        else:
+            super().__init__(f"API Error (status {status}): {error_json}")
 
 
-async def check_pajgps_availability(timeout: int = 15) -> bool:
+async def check_pajgps_availability(timeout: int = 15, session: aiohttp.ClientSession | None = None) -> bool:
     """
     Check if the PajGPS API is reachable by sending a HEAD request.
 
     Args:
         timeout: Timeout in seconds for the HEAD request
+        session: Shared client session to reuse (optional, a temporary one is created otherwise)
 
     Returns:
         True if API is reachable (status 200), False otherwise
     """
     try:
         timeout_config = aiohttp.ClientTimeout(total=timeout)
-        session = aiohttp.ClientSession(timeout=timeout_config)
+        own_session = session is None
+        if own_session:
+            session = aiohttp.ClientSession(timeout=timeout_config)
 
         try:
-            async with session.head(API_BASE_URL) as response:
+            async with session.head(API_BASE_URL, timeout=timeout_config) as response:
                 if response.status != 200:
                     _LOGGER.warning("API URL is not reachable (status %s)", response.status)
                     return False
                 return True
         finally:
-            await session.close()
+            if own_session:
+                await session.close()
 
     except (asyncio.TimeoutError, TimeoutError):
         _LOGGER.warning("Timeout while checking API URL")
@@ -59,7 +68,8 @@ async def make_request(
     payload: dict = None,
     params: dict = None,
     timeout: int = 5,
-    max_attempts: int = 3
+    max_attempts: int = 3,
+    session: aiohttp.ClientSession | None = None
 ):
     """
     Make an HTTP request with automatic retry on timeout.
@@ -72,6 +82,9 @@ async def make_request(
         params: URL query parameters (optional)
         timeout: Base timeout in seconds (multiplied by attempt number for each retry)
         max_attempts: Maximum number of retry attempts
+        session: Shared client session to reuse (optional). Reusing one session keeps
+            connections alive between requests; without it a temporary session is
+            created and closed for every attempt.
 
     Returns:
         Parsed JSON response
@@ -86,28 +99,16 @@ async def make_request(
 
     for attempt in range(max_attempts):
         try:
-            # Create session with timeout that increases with each attempt
+            # Timeout increases with each attempt
             timeout_config = aiohttp.ClientTimeout(total=timeout * (attempt + 1))
-            session = aiohttp.ClientSession(timeout=timeout_config)
+            if session is not None:
+                return await _send_request(session, method, url, headers, payload, params, timeout_config)
 
+            own_session = aiohttp.ClientSession(timeout=timeout_config)
             try:
-                # Make the request based on method
-                if method == "GET":
-                    response = await session.get(url, headers=headers, params=params)
-                elif method == "POST":
-                    response = await session.post(url, headers=headers, json=payload, params=params)
-                elif method == "PUT":
-                    response = await session.put(url, headers=headers, json=payload, params=params)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-
-                # Process the response
-                result = await _process_response(response, url)
-                await session.close()
-                return result
-
+                return await _send_request(own_session, method, url, headers, payload, params, timeout_config)
             finally:
-                await session.close()
+                await own_session.close()
 
         except (asyncio.TimeoutError, TimeoutError) as e:
             last_error = e
@@ -132,6 +133,33 @@ async def make_request(
     return None
 
 
+async def _send_request(
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    headers: dict,
+    payload: dict | None,
+    params: dict | None,
+    timeout_config: aiohttp.ClientTimeout,
+):
+    """
+    Send a single request on the given session and return the processed response.
+
+    Raises:
+        ValueError: If the HTTP method is not supported
+    """
+    if method == "GET":
+        response = await session.get(url, headers=headers, params=params, timeout=timeout_config)
+    elif method == "POST":
+        response = await session.post(url, headers=headers, json=payload, params=params, timeout=timeout_config)
+    elif method == "PUT":
+        response = await session.put(url, headers=headers, json=payload, params=params, timeout=timeout_config)
+    else:
+        raise ValueError(f"Unsupported HTTP method: {method}")
+
+    return await _process_response(response, url)
+
+
 async def _process_response(response, url: str):
     """
     Process HTTP response and extract JSON data.
@@ -167,7 +195,7 @@ async def _process_response(response, url: str):
             error_json = await response.json()
             if error_json.get("error"):
                 # Raise specific API error
-                raise ApiResponseError(error_json)
+                raise ApiResponseError(error_json, response.status)
         except ApiResponseError:
             # Re-raise ApiResponseError as-is
             raise
@@ -6,18 +6,25 @@ and updating their state based on the data received from the Paj GPS API.
 from __future__ import annotations
 
 from datetime import timedelta
+from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 from homeassistant.core import HomeAssistant
 from homeassistant import config_entries
-from homeassistant.helpers.entity import DeviceInfo
 
-from custom_components.pajgps.const import DOMAIN, VERSION
 from custom_components.pajgps.pajgps_data import PajGPSData
 import logging
 
+if TYPE_CHECKING:
+    # Only used in annotations, which are lazy thanks to `from __future__ import annotations`
+    from homeassistant.helpers.entity import DeviceInfo
+
 _LOGGER = logging.getLogger(__name__)
 SCAN_INTERVAL = timedelta(seconds=30)
+# Battery icons indexed by level // 10 (0-9 % → alert, 100 % → full)
+_BATTERY_ICONS = ("mdi:battery-alert", "mdi:battery-10", "mdi:battery-20", "mdi:battery-30",
+                  "mdi:battery-40", "mdi:battery-50", "mdi:battery-60", "mdi:battery-70",
+                  "mdi:battery-80", "mdi:battery-90", "mdi:battery")
 
 class PajGPSVoltageSensor(SensorEntity):
     """
@@ -33,7 +40,7 @@ class PajGPSVoltageSensor(SensorEntity):
         self._pajgps_data = pajgps_data
         self._device_id = device_id
         self._device_name = f"{self._pajgps_data.get_device(device_id).name}"
-        self._attr_unique_id = f"pajgps_{self._pajgps_data.guid}_{self._device_id}_voltage"
+        self._attr_unique_id = f"{self._pajgps_data.unique_id_prefix}{self._device_id}_voltage"
         self._attr_name = f"{self._device_name} Voltage"
         self._attr_icon = "mdi:flash"
         self._attr_suggested_display_precision = 1
@@ -75,13 +82,8 @@ class PajGPSVoltageSensor(SensorEntity):
     @property
     def native_value(self) -> float | None:
         if self._voltage is not None:
-            new_value = float(self._voltage)
             # Make sure value is between 0 and 300
-            if new_value < 0.0:
-                new_value = 0.0
-            elif new_value > 300.0:
-                new_value = 300.0
-            return new_value
+            return min(max(float(self._voltage), 0.0), 300.0)
 
     @property
     def native_unit_of_measurement(self) -> str | None:
@@ -101,7 +103,7 @@ class PajGPSBatterySensor(SensorEntity):
         self._pajgps_data = pajgps_data
         self._device_id = device_id
         self._device_name = f"{self._pajgps_data.get_device(device_id).name}"
-        self._attr_unique_id = f"pajgps_{self._pajgps_data.guid}_{self._device_id}_battery"
+        self._attr_unique_id = f"{self._pajgps_data.unique_id_prefix}{self._device_id}_battery"
         self._attr_name = f"{self._device_name} Battery Level"
         self._attr_icon = "mdi:battery"
 
@@ -141,13 +143,8 @@ class PajGPSBatterySensor(SensorEntity):
     @property
     def native_value(self) -> int | None:
         if self._battery_level is not None:
-            new_value = int(self._battery_level)
             # Make sure value is between 0 and 100
-            if new_value < 0:
-                new_value = 0
-            elif new_value > 100:
-                new_value = 100
-            return new_value
+            return min(max(int(self._battery_level), 0), 100)
         else:
             return None
 
@@ -159,31 +156,9 @@ class PajGPSBatterySensor(SensorEntity):
     def icon(self) -> str | None:
         """Set the icon based on battery level in 10% increments."""
         battery_level = self._battery_level
-        if battery_level is not None:
-            if battery_level == 100:
-                return "mdi:battery"
-            elif battery_level >= 90:
-                return "mdi:battery-90"
-            elif battery_level >= 80:
-                return "mdi:battery-80"
-            elif battery_level >= 70:
-                return "mdi:battery-70"
-            elif battery_level >= 60:
-                return "mdi:battery-60"
-            elif battery_level >= 50:
-                return "mdi:battery-50"
-            elif battery_level >= 40:
-                return "mdi:battery-40"
-            elif battery_level >= 30:
-                return "mdi:battery-30"
-            elif battery_level >= 20:
-                return "mdi:battery-20"
-            elif battery_level >= 10:
-                return "mdi:battery-10"
-            else:
-                return "mdi:battery-alert"
-        else:
+        if battery_level is None:
             return "mdi:battery-alert"
+        return _BATTERY_ICONS[min(max(int(battery_level), 0), 100) // 10]
 
 class PajGPSSpeedSensor(SensorEntity):
     """
@@ -199,7 +174,7 @@ class PajGPSSpeedSensor(SensorEntity):
         self._pajgps_data = pajgps_data
         self._device_id = device_id
         self._device_name = f"{self._pajgps_data.get_device(device_id).name}"
-        self._attr_unique_id = f"pajgps_{self._pajgps_data.guid}_{self._device_id}_speed"
+        self._attr_unique_id = f"{self._pajgps_data.unique_id_prefix}{self._device_id}_speed"
         self._attr_name = f"{self._device_name} Speed"
         self._attr_icon = "mdi:speedometer"
 
@@ -239,13 +214,8 @@ class PajGPSSpeedSensor(SensorEntity):
     @property
     def native_value(self) -> float | None:
         if self._speed is not None:
-            new_value = float(self._speed)
             # Make sure value is between 0 and 1000
-            if new_value < 0.0:
-                new_value = 0.0
-            elif new_value > 1000.0:
-                new_value = 1000.0
-            return new_value
+            return min(max(float(self._speed), 0.0), 1000.0)
         else:
             return None
 
@@ -267,7 +237,7 @@ class PajGPSElevationSensor(SensorEntity):
         self._pajgps_data = pajgps_data
         self._device_id = device_id
         self._device_name = f"{self._pajgps_data.get_device(device_id).name}"
-        self._attr_unique_id = f"pajgps_{self._pajgps_data.guid}_{self._device_id}_elevation"
+        self._attr_unique_id = f"{self._pajgps_data.unique_id_prefix}{self._device_id}_elevation"
         self._attr_name = f"{self._device_name} Elevation"
         self._attr_icon = "mdi:map-marker-up"
         self._attr_suggested_display_precision = 1
@@ -309,13 +279,8 @@ class PajGPSElevationSensor(SensorEntity):
     @property
     def native_value(self) -> float | None:
         if self._elevation is not None:
-            new_value = float(self._elevation)
             # Make sure value is between 0 and 10000
-            if new_value < 0.0:
-                new_value = 0.0
-            elif new_value > 10000.0:
-                new_value = 10000.0
-            return new_value
+            return min(max(float(self._elevation), 0.0), 10000.0)
         else:
             return None
 
@@ -339,7 +304,7 @@ class PajGPSTotalUpdateTimeSensor(SensorEntity):
         self._pajgps_data = pajgps_data
         self._device_id = device_id
         self._device_name = f"{self._pajgps_data.get_device(device_id).name}"
-        self._attr_unique_id = f"pajgps_{self._pajgps_data.guid}_{self._device_id}_total_update_time"
+        self._attr_unique_id = f"{self._pajgps_data.unique_id_prefix}{self._device_id}_total_update_time"
         self._attr_name = f"{self._device_name} Total Update Time"
         self._attr_icon = "mdi:timer"
 
@@ -410,9 +375,7 @@ async def async_setup_entry(
     # Create main Paj GPS data object from pajgps_data.py
     pajgps_data = PajGPSData.get_instance(guid, entry_name, email, password, mark_alerts_as_read, fetch_elevation, force_battery)
 
-    # Update the data
-    await pajgps_data.update_pajgps_data()
-
+    # Data was already fetched by async_initialize_data before the platforms were forwarded
     # Add the Paj GPS sensors to the entity registry
     devices = pajgps_data.get_device_ids()
     if devices is not None:
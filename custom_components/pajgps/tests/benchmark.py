@@ -5,7 +5,9 @@ This script measures the time taken by each API call and provides statistics
 about performance over multiple update cycles.
 
 Usage:
-    python benchmark.py [--iterations N] [--output FILE] [--delay SECONDS]
+    python benchmark.py [--iterations N] [--output FILE] [--delay SECONDS] [--concurrency N]
+                        [--force-refresh] [--keep-samples] [--no-adaptive-delay]
+                        [--profile {none,scalene,cprofile}] [--quiet]
 
 Examples:
     python benchmark.py                       # Run with default 5 iterations
@@ -13,38 +15,111 @@ Examples:
     python benchmark.py -o results.json       # Export results to JSON
     python benchmark.py -i 10 -o results.json # 10 iterations + export
     python benchmark.py -i 5 -d 2.0           # 5 iterations with 2 second delay
+    python benchmark.py -c 4                  # At most 4 sensor requests in flight
+    python benchmark.py --force-refresh       # Fetch a new token every iteration
+    python benchmark.py -o r.json --keep-samples  # Include every measured time in the export
+    python benchmark.py --no-adaptive-delay   # Never lengthen the delay after throttling
+    python benchmark.py --profile cprofile    # Print the hottest functions after the run
+    python benchmark.py -q -o results.json    # Only print the summary
+    python -m scalene --off benchmark.py --profile scalene  # Line-level profile with Scalene
 """
 
+import array
 import asyncio
 import argparse
-import json
+import contextlib
+import logging
+import math
 import os
+import random
+import re
 import sys
 import time
 from typing import Dict, List
-from statistics import mean, median, stdev
+from statistics import median
+import orjson
 from dotenv import load_dotenv
 
+try:
+    # NumPy is optional; when present the median is computed in C instead of by sorting in Python
+    import numpy as np
+except ImportError:
+    np = None
+
 # Add parent directory to path to import pajgps_data
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 
 import custom_components.pajgps.pajgps_data as pajgps_data
+from custom_components.pajgps import models
+from custom_components.pajgps.api import auth, positions, sensors
+from custom_components.pajgps.requests import make_request, ApiResponseError
 
+# Elevation of a spot does not change, an hour only bounds how long stale entries are kept
+ELEVATION_CACHE_TTL = 3600
 
-class BenchmarkMetrics:
-    """Store timing metrics for a single operation."""
+# Per-device sensor requests slower than this are listed in the iteration output
+SLOW_SENSOR_NS = 1_000_000_000
+
+# Log messages and errors that point at an overloaded server: timeouts and HTTP 429 / 5xx statuses
+THROTTLE_PATTERN = re.compile(r"timeout|\b(?:status|HTTP) (?:429|5\d\d)\b", re.IGNORECASE)
 
-    def __init__(self, name: str):
-        self.name = name
-        self.times: List[float] = []
 
-    def add_time(self, duration: float):
-        """Add a timing measurement."""
-        self.times.append(duration)
+class BenchmarkMetrics:
+    """Store timing metrics for a single operation.
+
+    Count, min, max, mean and variance are kept as running values (Welford), so memory
+    does not grow with the number of iterations. The median comes from a bounded
+    reservoir sample, which is exact until more than RESERVOIR_SIZE times are recorded.
+    With keep_samples every time is retained instead, for export.
+
+    Times are recorded as integer nanoseconds from perf_counter_ns and only
+    converted to seconds when statistics are read.
+    """
+
+    RESERVOIR_SIZE = 1024
+
+    __slots__ = ('name', 'keep_samples', 'count', 'mean_ns', 'm2', 'min_ns', 'max_ns', 'total_ns', 'last_ns', 'samples')
+
+    def __init__(self, name: str, keep_samples: bool = False):
+        self.name: str = name
+        self.keep_samples: bool = keep_samples
+        self.count: int = 0
+        self.mean_ns: float = 0.0
+        self.m2: float = 0.0
+        self.min_ns: int = 0
+        self.max_ns: int = 0
+        self.total_ns: int = 0
+        self.last_ns: int = 0
+        self.samples: List[int] = []
+
+    @property
+    def last(self) -> float:
+        """Most recent measurement in seconds."""
+        return self.last_ns / 1e9
+
+    def add_time_ns(self, duration_ns: int):
+        """Add a timing measurement in nanoseconds."""
+        self.count += 1
+        delta = duration_ns - self.mean_ns
+        self.mean_ns += delta / self.count
+        self.m2 += delta * (duration_ns - self.mean_ns)
+        if self.count == 1 or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.total_ns += duration_ns
+        self.last_ns = duration_ns
+
+        if self.keep_samples or len(self.samples) < self.RESERVOIR_SIZE:
+            self.samples.append(duration_ns)
+        else:
+            slot = random.randrange(self.count)
+            if slot < self.RESERVOIR_SIZE:
+                self.samples[slot] = duration_ns
 
     def get_stats(self) -> Dict[str, float]:
-        """Calculate statistics for collected times."""
-        if not self.times:
+        """Calculate statistics for collected times, in seconds."""
+        if not self.count:
             return {
                 'count': 0,
                 'min': 0.0,
@@ -55,25 +130,81 @@ class BenchmarkMetrics:
                 'total': 0.0
             }
 
+        if np is not None:
+            sample_median_ns = float(np.median(np.asarray(self.samples, dtype=np.int64)))
+        else:
+            sample_median_ns = median(self.samples)
+
         return {
-            'count': len(self.times),
-            'min': min(self.times),
-            'max': max(self.times),
-            'avg': mean(self.times),
-            'median': median(self.times),
-            'stdev': stdev(self.times) if len(self.times) > 1 else 0.0,
-            'total': sum(self.times)
+            'count': self.count,
+            'min': self.min_ns / 1e9,
+            'max': self.max_ns / 1e9,
+            'avg': self.mean_ns / 1e9,
+            'median': sample_median_ns / 1e9,
+            'stdev': math.sqrt(self.m2 / (self.count - 1)) / 1e9 if self.count > 1 else 0.0,
+            'total': self.total_ns / 1e9
         }
 
 
+class ThrottleCounter(logging.Handler):
+    """Count timeout and HTTP 429/5xx warnings and errors logged by the integration.
+
+    The API layer logs and swallows request failures (timeouts, error responses),
+    so log records are the only place where signs of server throttling show up.
+    Other warnings, such as stale data being kept, are not throttling and are ignored.
+    """
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+        self.events = 0
+
+    def emit(self, record: logging.LogRecord):
+        if THROTTLE_PATTERN.search(record.getMessage()):
+            self.events += 1
+
+
 class PajGPSBenchmark:
     """Benchmark suite for PajGPS integration."""
 
-    def __init__(self, iterations: int = 5, output_file: str = None, delay: float = 0.5):
+    METRIC_NAMES = (
+        "login_get_token",
+        "refresh_token",
+        "update_devices",
+        "update_positions",
+        "update_alerts",
+        "update_sensors",
+        "update_elevation",
+        "update_elevation_cached",
+        "full_update_measured",
+        "background_tasks_wait",
+    )
+
+    def __init__(self, iterations: int = 5, output_file: str = None, delay: float = 0.5, concurrency: int = sensors.MAX_CONCURRENT_REQUESTS,
+                 force_refresh: bool = False, keep_samples: bool = False, adaptive_delay: bool = True,
+                 quiet: bool = False):
         self.iterations = iterations
         self.output_file = output_file
         self.delay = delay
-        self.metrics: Dict[str, BenchmarkMetrics] = {}
+        self.concurrency = concurrency
+        self.force_refresh = force_refresh
+        self.keep_samples = keep_samples
+        self.adaptive_delay = adaptive_delay
+        self.quiet = quiet
+        # Per-iteration output, collected while timing and printed at the end of the iteration
+        self._lines: List[str] = []
+        self._throttle = ThrottleCounter()
+        self._sem: asyncio.Semaphore | None = None
+        # Per-device sensor timings of the current iteration, as parallel arrays indexed like self.data.devices
+        self._sensor_ids = array.array('q')
+        self._sensor_dur_ns = array.array('q')
+        # Whether the API answered a multi-device sensor query, decided once in setup()
+        self._bulk_sensors = False
+        self._bulk_error: str | None = None  # exception name of a failed bulk request, reported once
+        # (lat, lng) rounded like fetch_elevation does -> (elevation, fetched_at)
+        self._elevation_cache: Dict[tuple[float, float], tuple[float, float]] = {}
+        self.metrics: Dict[str, BenchmarkMetrics] = {
+            name: BenchmarkMetrics(name, keep_samples) for name in self.METRIC_NAMES
+        }
         self.data: pajgps_data.PajGPSData | None = None
         self.device_count = 0
         self.start_timestamp = None
@@ -81,20 +212,32 @@ class PajGPSBenchmark:
     def _get_metric(self, name: str) -> BenchmarkMetrics:
         """Get or create a metric tracker."""
         if name not in self.metrics:
-            self.metrics[name] = BenchmarkMetrics(name)
+            self.metrics[name] = BenchmarkMetrics(name, self.keep_samples)
         return self.metrics[name]
 
+    @contextlib.asynccontextmanager
+    async def _time(self, name: str):
+        """Measure the enclosed block and record it under a pre-registered metric."""
+        metric = self.metrics[name]
+        start = time.perf_counter_ns()
+        try:
+            yield metric
+        finally:
+            metric.add_time_ns(time.perf_counter_ns() - start)
+
     async def _timed_call(self, metric_name: str, coro):
         """Execute a coroutine and measure its execution time."""
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()
         try:
             result = await coro
-            duration = time.perf_counter() - start_time
-            self._get_metric(metric_name).add_time(duration)
-            return result, duration
+            duration_ns = time.perf_counter_ns() - start_time
+            self._get_metric(metric_name).add_time_ns(duration_ns)
+            return result, duration_ns / 1e9
         except Exception as e:
-            duration = time.perf_counter() - start_time
-            self._get_metric(f"{metric_name}_ERROR").add_time(duration)
+            duration_ns = time.perf_counter_ns() - start_time
+            self._get_metric(f"{metric_name}_ERROR").add_time_ns(duration_ns)
+            if isinstance(e, TimeoutError) or THROTTLE_PATTERN.search(str(e)):
+                self._throttle.events += 1
             raise
 
     async def setup(self):
@@ -107,6 +250,8 @@ class PajGPSBenchmark:
             raise ValueError("PAJGPS_EMAIL and PAJGPS_PASSWORD must be set in .env file")
 
         print("Setting up benchmark...")
+        # Same cap on in-flight per-device sensor requests as sensors.fetch_sensors applies in the integration
+        self._sem = asyncio.Semaphore(self.concurrency)
         await pajgps_data.PajGPSData.clean_instances()
         self.data = pajgps_data.PajGPSData.get_instance(
             "benchmark-guid",
@@ -117,129 +262,257 @@ class PajGPSBenchmark:
             fetch_elevation=True,
             force_battery=True
         )
+
+        # Probed before the throttle counter is attached, a rejected probe is not a throttling signal
+        await self.data.refresh_token()
+        await self.data.update_devices_data()
+        self._bulk_sensors = await self._probe_bulk_sensors()
+        sensor_mode = "one bulk request" if self._bulk_sensors else "one request per device"
+        print(f"Sensor data: {sensor_mode}")
+        logging.getLogger("custom_components.pajgps").addHandler(self._throttle)
         delay_msg = f"{self.delay}s" if self.delay > 0 else "no delay"
+        if self.adaptive_delay and self.delay > 0:
+            delay_msg += ", adaptive"
         print(f"Benchmark initialized for {self.iterations} iterations (delay: {delay_msg})")
         print()
 
     async def cleanup(self):
         """Clean up resources."""
+        logging.getLogger("custom_components.pajgps").removeHandler(self._throttle)
         if self.data:
             await self.data.async_close()
         await pajgps_data.PajGPSData.clean_instances()
 
     async def benchmark_login(self):
         """Benchmark login token retrieval."""
-        _, duration = await self._timed_call(
+        token, duration = await self._timed_call(
             "login_get_token",
-            self.data.get_login_token()
+            auth.get_login_token(self.data.email, self.data.password, self.data.get_session())
         )
+        # Seed the instance so later refreshes reuse this token until its TTL runs out
+        if token:
+            self.data.token = token
+            self.data.last_token_update = time.time()
         return duration
 
-    async def run_single_iteration(self, iteration: int):
-        """Run a single benchmark iteration."""
-        print(f"Iteration {iteration + 1}/{self.iterations}:")
-        print("-" * 60)
-
-        # Login (only first iteration)
-        if iteration == 0:
-            duration = await self.benchmark_login()
-            print(f"  ✓ Login token:          {duration * 1000:7.2f} ms")
-
-        # Full update cycle with internal component timing
-        start_full = time.perf_counter()
-
-        # Refresh token
-        start = time.perf_counter()
-        await self.data.refresh_token(forced=True)
-        duration = time.perf_counter() - start
-        self._get_metric("refresh_token").add_time(duration)
-        print(f"  ✓ Refresh token:        {duration * 1000:7.2f} ms")
+    async def benchmark_elevation(self, device_id: int):
+        """Benchmark elevation lookup for one device, reusing results for unchanged coordinates."""
+        position = self.data.get_position(device_id)
+        if position is None:
+            return
+
+        key = (round(position.lat, 5), round(position.lng, 5))
+        cached = self._elevation_cache.get(key)
+        if cached is not None and time.time() - cached[1] < ELEVATION_CACHE_TTL:
+            async with self._time("update_elevation_cached") as t:
+                position.elevation = cached[0]
+            self._lines.append(f"  ✓ Update elevation:     {t.last * 1000:7.2f} ms (1 device, cached)")
+            return
+
+        async with self._time("update_elevation") as t:
+            elevation = await positions.fetch_elevation(device_id, position, self.data.get_session())
+        if elevation is not None:
+            position.elevation = round(elevation)
+            self._elevation_cache[key] = (position.elevation, time.time())
+        self._lines.append(f"  ✓ Update elevation:     {t.last * 1000:7.2f} ms (1 device)")
+
+    async def _fetch_one(self, idx: int, device, headers: dict):
+        """Fetch the voltage of a single device, recording its timing at the given index."""
+        async with self._sem:
+            device_start = time.perf_counter_ns()
+            try:
+                voltage = await sensors._fetch_device_voltage(device.id, headers, self.data.get_session())
+            except Exception:
+                voltage = None  # Error handling like in original
+            self._sensor_ids[idx] = device.id
+            self._sensor_dur_ns[idx] = time.perf_counter_ns() - device_start
+            return voltage
+
+    def _slow_sensors(self) -> List[str]:
+        """Describe the devices whose sensor request took longer than SLOW_SENSOR_NS."""
+        if np is not None:
+            slow_idx = np.flatnonzero(np.frombuffer(self._sensor_dur_ns, dtype=np.int64) > SLOW_SENSOR_NS).tolist()
+        else:
+            slow_idx = [i for i, dur in enumerate(self._sensor_dur_ns) if dur > SLOW_SENSOR_NS]
+        return [f"dev{self._sensor_ids[i]}:{self._sensor_dur_ns[i] // 1_000_000}ms" for i in slow_idx]
 
-        # Update devices
-        start = time.perf_counter()
-        await self.data.update_devices_data()
-        duration = time.perf_counter() - start
-        self._get_metric("update_devices").add_time(duration)
-        device_count = len(self.data.devices)
-        print(f"  ✓ Update devices:       {duration * 1000:7.2f} ms ({device_count} devices)")
-
-        # Update positions
-        start = time.perf_counter()
-        await self.data.update_position_data()
-        duration = time.perf_counter() - start
-        self._get_metric("update_positions").add_time(duration)
+    async def _update_positions(self) -> str:
+        """Update positions and return the output line with the timing."""
+        async with self._time("update_positions") as t:
+            await self.data.update_position_data()
         position_count = len(self.data.positions)
-        print(f"  ✓ Update positions:     {duration * 1000:7.2f} ms ({position_count} positions)")
+        return f"  ✓ Update positions:     {t.last * 1000:7.2f} ms ({position_count} positions)"
 
-        # Update alerts
-        start = time.perf_counter()
-        await self.data.update_alerts_data()
-        duration = time.perf_counter() - start
-        self._get_metric("update_alerts").add_time(duration)
+    async def _update_alerts(self) -> str:
+        """Update alerts and return the output line with the timing."""
+        async with self._time("update_alerts") as t:
+            await self.data.update_alerts_data()
         alert_count = len(self.data.alerts)
         bg_tasks_count = len(self.data._background_tasks)
-        print(f"  ✓ Update alerts:        {duration * 1000:7.2f} ms ({alert_count} alerts, {bg_tasks_count} bg tasks)")
+        return f"  ✓ Update alerts:        {t.last * 1000:7.2f} ms ({alert_count} alerts, {bg_tasks_count} bg tasks)"
 
-        # Update sensors (may be slow, calls API per device)
-        start = time.perf_counter()
-        sensor_times = []
-        headers = self.data.get_standard_headers()
-        new_sensors = []
+    def _bulk_sensor_params(self, device_ids: List[int]) -> dict:
+        """Query parameters of a multi-device sensor request."""
+        return {"ids": ",".join(str(device_id) for device_id in device_ids)}
 
-        for device in self.data.devices:
-            device_start = time.perf_counter()
-            url = f"https://connect.paj-gps.de/api/v1/sensordata/last/{device.id}"
-            try:
-                json = await self.data.make_get_request(url, headers)
-                sensor_data = pajgps_data.PajGPSSensorData()
-                if "success" in json and "volt" in json["success"]:
-                    sensor_data.device_id = device.id
-                    sensor_data.voltage = round(json["success"]["volt"] / 1000, 1)
-                    new_sensors.append(sensor_data)
-                else:
-                    sensor_data.device_id = device.id
-                    sensor_data.voltage = 0.0
-                    new_sensors.append(sensor_data)
-            except Exception as e:
-                pass  # Error handling like in original
-
-            device_duration = time.perf_counter() - device_start
-            sensor_times.append((device.id, device_duration))
-
-        self.data.sensors = new_sensors
-        duration = time.perf_counter() - start
-        self._get_metric("update_sensors").add_time(duration)
+    async def _probe_bulk_sensors(self) -> bool:
+        """
+        Check once whether /sensordata/last accepts several device ids in one request.
+
+        The endpoint is only documented per device, so a bulk answer is accepted only if
+        it has the shape {"success": [{"did": ..., "volt": ...}, ...]} and covers every
+        requested device.
+        """
+        device_ids = self.data.get_device_ids()[:3]
+        if not device_ids:
+            return False
+        try:
+            raw_json = await make_request(
+                "GET", sensors.API_URL + "sensordata/last", self.data.get_standard_headers(),
+                params=self._bulk_sensor_params(device_ids), session=self.data.get_session()
+            )
+        except Exception:
+            return False
+        entries = raw_json.get("success") if isinstance(raw_json, dict) else None
+        if not isinstance(entries, list) or not entries:
+            return False
+        if not all(isinstance(entry, dict) and "did" in entry and "volt" in entry for entry in entries):
+            return False
+        # An endpoint that ignores the ids could answer with other devices, or none at all
+        return set(device_ids) <= {entry["did"] for entry in entries}
+
+    async def _fetch_sensors_bulk(self, headers: dict) -> bool:
+        """
+        Fetch the voltage of all devices with a single request.
+
+        Returns False if the request or its response failed; bulk mode is then switched off
+        and the caller falls back to one request per device.
+        """
+        device_ids = self.data.get_device_ids()
+        try:
+            raw_json = await make_request(
+                "GET", sensors.API_URL + "sensordata/last", headers,
+                params=self._bulk_sensor_params(device_ids), session=self.data.get_session()
+            )
+            # Convert from millivolts to volts and round to 1 decimal place, like the per-device call
+            volts = {entry["did"]: round(entry["volt"] / 1000, 1) for entry in raw_json["success"]}
+        except (ApiResponseError, TimeoutError, ValueError, KeyError, TypeError) as e:
+            self._bulk_error = type(e).__name__
+            self._bulk_sensors = False
+            return False
+        self.data.sensors = [
+            models.PajGPSSensorData(device_id, volts[device_id])
+            for device_id in device_ids
+            if device_id in volts
+        ]
+        return True
+
+    async def _update_sensors_concurrent(self) -> List[str]:
+        """
+        Update sensors in one bulk call if supported, else one call per device dispatched concurrently.
+        Returns the output lines with the timing.
+        """
+        lines = []
+        async with self._time("update_sensors") as t:
+            headers = self.data.get_standard_headers()
+            self._sensor_ids = array.array('q')
+            self._sensor_dur_ns = array.array('q')
+            if not (self._bulk_sensors and await self._fetch_sensors_bulk(headers)):
+                devices = self.data.devices
+                self._sensor_ids = array.array('q', [0]) * len(devices)
+                self._sensor_dur_ns = array.array('q', [0]) * len(devices)
+                voltages = await asyncio.gather(
+                    *(self._fetch_one(idx, device, headers) for idx, device in enumerate(devices))
+                )
+
+                self.data.sensors = [
+                    models.PajGPSSensorData(device.id, voltage)
+                    for device, voltage in zip(devices, voltages, strict=True)
+                    if voltage is not None
+                ]
+        duration = t.last
         sensor_count = len(self.data.sensors)
 
+        if self._bulk_error:
+            lines.append(f"  ! Bulk sensor request failed ({self._bulk_error}), using one request per device")
+            self._bulk_error = None
+
         # Show per-device times if any took >1s
-        slow_sensors = [f"dev{did}:{t*1000:.0f}ms" for did, t in sensor_times if t > 1.0]
+        slow_sensors = self._slow_sensors()
         if slow_sensors:
-            print(f"  ✓ Update sensors:       {duration * 1000:7.2f} ms ({sensor_count} sensors) [SLOW: {', '.join(slow_sensors)}]")
+            lines.append(f"  ✓ Update sensors:       {duration * 1000:7.2f} ms ({sensor_count} sensors) [SLOW: {', '.join(slow_sensors)}]")
         else:
-            print(f"  ✓ Update sensors:       {duration * 1000:7.2f} ms ({sensor_count} sensors)")
-
-        # Update elevation (single device)
-        if self.data.fetch_elevation and device_count > 0:
-            start = time.perf_counter()
-            await self.data.update_elevation(self.data.get_device_ids()[0])
-            duration = time.perf_counter() - start
-            self._get_metric("update_elevation").add_time(duration)
-            print(f"  ✓ Update elevation:     {duration * 1000:7.2f} ms (1 device)")
-
-        # Calculate total time for full update
-        full_duration = time.perf_counter() - start_full
-        self._get_metric("full_update_measured").add_time(full_duration)
-        print(f"  ✓ Full update (sum):    {full_duration * 1000:7.2f} ms")
-
-        # Wait for background tasks to complete
+            lines.append(f"  ✓ Update sensors:       {duration * 1000:7.2f} ms ({sensor_count} sensors)")
+        return lines
+
+    async def run_single_iteration(self, iteration: int):
+        """Run a single benchmark iteration."""
+        self._lines.append(f"Iteration {iteration + 1}/{self.iterations}:")
+        self._lines.append("-" * 60)
+
+        # Login (only first iteration)
+        if iteration == 0:
+            duration = await self.benchmark_login()
+            self._lines.append(f"  ✓ Login token:          {duration * 1000:7.2f} ms")
+
+        # Full update cycle with internal component timing
+        async with self._time("full_update_measured") as full:
+            async with self._time("refresh_token") as t:
+                await self.data.refresh_token(forced=self.force_refresh)
+            self._lines.append(f"  ✓ Refresh token:        {t.last * 1000:7.2f} ms")
+
+            async with self._time("update_devices") as t:
+                await self.data.update_devices_data()
+            device_count = len(self.data.devices)
+            self._lines.append(f"  ✓ Update devices:       {t.last * 1000:7.2f} ms ({device_count} devices)")
+
+            # Positions, alerts and sensors only depend on the device list, so run them side by side
+            async with asyncio.TaskGroup() as tg:
+                positions_task = tg.create_task(self._update_positions())
+                alerts_task = tg.create_task(self._update_alerts())
+                sensors_task = tg.create_task(self._update_sensors_concurrent())
+            # The tasks finish in any order, their lines are reported in a fixed one
+            self._lines.append(positions_task.result())
+            self._lines.append(alerts_task.result())
+            self._lines.extend(sensors_task.result())
+
+            # Update elevation (single device)
+            if self.data.fetch_elevation and device_count > 0:
+                await self.benchmark_elevation(self.data.get_device_ids()[0])
+
+        self._lines.append(f"  ✓ Full update (wall):   {full.last * 1000:7.2f} ms")
+
+        # Wait between iterations to avoid rate limiting, letting background tasks finish meanwhile
+        delay = self._next_delay() if iteration < self.iterations - 1 else 0
         if self.data._background_tasks:
-            start_time = time.perf_counter()
-            await asyncio.gather(*self.data._background_tasks, return_exceptions=True)
-            duration = time.perf_counter() - start_time
-            self._get_metric("background_tasks_wait").add_time(duration)
-            print(f"  ✓ Background tasks:     {duration * 1000:7.2f} ms")
+            await asyncio.gather(asyncio.sleep(delay), self._wait_background_tasks())
+        elif delay > 0:
+            await asyncio.sleep(delay)
 
-        print()
+        # Terminal output can block, so it is written in one go once nothing is being timed
+        if not self.quiet:
+            sys.stdout.write("\n".join(self._lines) + "\n\n")
+            sys.stdout.flush()
+        self._lines.clear()
+
+    def _next_delay(self) -> float:
+        """
+        Return the delay before the next iteration.
+
+        With adaptive delay the base delay grows by one step for every throttling
+        event seen (timeouts, HTTP 429/5xx), and the count decays by one each iteration.
+        """
+        if not self.adaptive_delay:
+            return self.delay
+        events = self._throttle.events
+        self._throttle.events = max(0, events - 1)
+        return self.delay * (1 + events)
+
+    async def _wait_background_tasks(self):
+        """Wait for the integration's background tasks and measure how long that took."""
+        async with self._time("background_tasks_wait") as t:
+            await self.data.async_wait_idle()
+        self._lines.append(f"  ✓ Background tasks:     {t.last * 1000:7.2f} ms")
 
     async def run(self):
         """Run the complete benchmark suite."""
@@ -256,10 +529,6 @@ class PajGPSBenchmark:
         for i in range(self.iterations):
             await self.run_single_iteration(i)
 
-            # Wait between iterations to avoid rate limiting
-            if i < self.iterations - 1 and self.delay > 0:
-                await asyncio.sleep(self.delay)
-
         total_time = time.perf_counter() - start_time
 
         # Store device count for export
@@ -281,25 +550,19 @@ class PajGPSBenchmark:
         print("=" * 60)
         print()
 
-        # Sort metrics by average time (descending)
-        sorted_metrics = sorted(
-            [(name, metric.get_stats()) for name, metric in self.metrics.items()],
-            key=lambda x: x[1]['avg'],
-            reverse=True
-        )
+        # Compute every metric's stats once, then sort by average time (descending)
+        computed = [(name, metric.get_stats()) for name, metric in self.metrics.items()]
+        sorted_metrics = sorted(computed, key=lambda x: x[1]['avg'], reverse=True)
 
         print(f"{'Operation':<25} {'Count':>5} {'Min':>8} {'Avg':>8} {'Max':>8} {'Median':>8} {'StdDev':>8} {'Total':>8}")
         print("-" * 110)
 
         for name, stats in sorted_metrics:
-            if stats['count'] > 0:
-                print(f"{name:<25} {stats['count']:>5} "
-                      f"{stats['min']*1000:>7.1f}ms "
-                      f"{stats['avg']*1000:>7.1f}ms "
-                      f"{stats['max']*1000:>7.1f}ms "
-                      f"{stats['median']*1000:>7.1f}ms "
-                      f"{stats['stdev']*1000:>7.1f}ms "
-                      f"{stats['total']*1000:>7.1f}ms")
+            if stats['count'] == 0:
+                continue
+            mn, av, mx, md, sd, tot = (stats[k] * 1000 for k in ('min', 'avg', 'max', 'median', 'stdev', 'total'))
+            print(f"{name:<25} {stats['count']:>5} "
+                  f"{mn:>7.1f}ms {av:>7.1f}ms {mx:>7.1f}ms {md:>7.1f}ms {sd:>7.1f}ms {tot:>7.1f}ms")
 
         print("-" * 110)
         print(f"Total benchmark time: {total_time:.2f}s")
@@ -343,7 +606,7 @@ class PajGPSBenchmark:
                 print(f"💡 Sensor updates:")
                 print(f"   • {devices_count} devices")
                 print(f"   • {sensor_stats['avg']*1000:.1f}ms total ({avg_per_device*1000:.1f}ms per device)")
-                print(f"   • This makes {devices_count} sequential API calls")
+                print(f"   • This makes {devices_count} concurrent API calls")
                 print()
 
         # Recommendations
@@ -367,20 +630,27 @@ class PajGPSBenchmark:
 
         for name, metric in self.metrics.items():
             stats = metric.get_stats()
-            results['metrics'][name] = {
+            if stats['count'] == 0:
+                continue
+            exported = {
                 'count': stats['count'],
                 'min_ms': stats['min'] * 1000,
                 'max_ms': stats['max'] * 1000,
                 'avg_ms': stats['avg'] * 1000,
                 'median_ms': stats['median'] * 1000,
                 'stdev_ms': stats['stdev'] * 1000,
-                'total_ms': stats['total'] * 1000,
-                'all_times_ms': [t * 1000 for t in metric.times]
+                'total_ms': stats['total'] * 1000
             }
+            if metric.keep_samples:
+                if np is not None:
+                    exported['all_times_ms'] = (np.asarray(metric.samples, dtype=np.int64) / 1e6).tolist()
+                else:
+                    exported['all_times_ms'] = [t / 1e6 for t in metric.samples]
+            results['metrics'][name] = exported
 
         try:
-            with open(self.output_file, 'w') as f:
-                json.dump(results, f, indent=2)
+            with open(self.output_file, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
             print(f"✅ Results exported to: {self.output_file}")
             print()
         except Exception as e:
@@ -403,6 +673,12 @@ Examples:
   %(prog)s -d 2.0                   Use 2 second delay between iterations
   %(prog)s -i 10 -d 1.5             10 iterations with 1.5 second delay
   %(prog)s -d 0                     No delay between iterations (faster but may hit rate limits)
+  %(prog)s -c 4                     At most 4 concurrent sensor requests
+  %(prog)s --force-refresh          Fetch a new token every iteration instead of reusing it
+  %(prog)s -o r.json --keep-samples Include every measured time in the JSON export
+  %(prog)s --no-adaptive-delay      Never lengthen the delay after throttling
+  %(prog)s --profile cprofile       Profile the run with cProfile
+  %(prog)s -q -o results.json       Skip per-iteration output, only print the summary
         """
     )
 
@@ -427,9 +703,89 @@ Examples:
         help='Delay in seconds between iterations (default: 0.5, use 0 for no delay)'
     )
 
+    parser.add_argument(
+        '--adaptive-delay',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help='Lengthen the delay with every timeout or HTTP 429/5xx seen (default: on)'
+    )
+
+    parser.add_argument(
+        '-c', '--concurrency',
+        type=int,
+        default=sensors.MAX_CONCURRENT_REQUESTS,
+        help=f'Maximum number of concurrent per-device sensor requests (default: {sensors.MAX_CONCURRENT_REQUESTS}, like the integration)'
+    )
+
+    parser.add_argument(
+        '--force-refresh',
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help='Fetch a new token every iteration instead of reusing it until it expires (default: off)'
+    )
+
+    parser.add_argument(
+        '--keep-samples',
+        action='store_true',
+        help='Keep every measured time and include it as all_times_ms in the JSON export (default: off)'
+    )
+
+    parser.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help='Do not print per-iteration timings, only the summary (default: off)'
+    )
+
+    parser.add_argument(
+        '--profile',
+        choices=['none', 'scalene', 'cprofile'],
+        default='none',
+        help='Profile the benchmark itself (default: none). scalene requires launching via '
+             '"python -m scalene --off benchmark.py"'
+    )
+
     return parser.parse_args()
 
 
+def start_profiler(kind: str, output_file: str | None):
+    """
+    Start the requested profiler and return a callable that stops it and reports.
+
+    Scalene samples with low overhead (about 2% median) and writes its own report,
+    so it only has to be switched on and off around the run. cProfile is
+    deterministic and noticeably slower; its stats are printed and, with --output,
+    also saved next to the JSON results.
+    """
+    if kind == 'scalene':
+        try:
+            from scalene import scalene_profiler
+        except ImportError:
+            print("Error: scalene is not installed (pip install scalene)")
+            sys.exit(1)
+        scalene_profiler.start()
+        return scalene_profiler.stop
+
+    if kind == 'cprofile':
+        import cProfile
+        import pstats
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+        def stop():
+            profiler.disable()
+            stats = pstats.Stats(profiler).sort_stats(pstats.SortKey.CUMULATIVE)
+            stats.print_stats(25)
+            if output_file:
+                profile_file = os.path.splitext(output_file)[0] + ".prof"
+                stats.dump_stats(profile_file)
+                print(f"✅ Profile saved to: {profile_file}")
+
+        return stop
+
+    return lambda: None
+
+
 async def main():
     """Main entry point."""
     args = parse_args()
@@ -442,12 +798,22 @@ async def main():
         print("Error: delay must be 0 or greater")
         sys.exit(1)
 
+    if args.concurrency < 1:
+        print("Error: concurrency must be at least 1")
+        sys.exit(1)
+
     benchmark = PajGPSBenchmark(
         iterations=args.iterations,
         output_file=args.output,
-        delay=args.delay
+        delay=args.delay,
+        concurrency=args.concurrency,
+        force_refresh=args.force_refresh,
+        keep_samples=args.keep_samples,
+        adaptive_delay=args.adaptive_delay,
+        quiet=args.quiet
     )
 
+    stop_profiler = start_profiler(args.profile, args.output)
     try:
         await benchmark.run()
     except KeyboardInterrupt:
@@ -460,8 +826,18 @@ async def main():
         traceback.print_exc()
         await benchmark.cleanup()
         sys.exit(1)
+    finally:
+        stop_profiler()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop is optional; it lowers scheduling overhead for the many small awaits measured here
+    # Passed as a loop factory (like the tests) instead of replacing the global loop policy;
+    # asyncio.Runner takes loop_factory on 3.11, asyncio.run only from 3.12
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop is not None else None) as runner:
+        runner.run(main())
 
@@ -2,28 +2,110 @@ import os
 import time
 import asyncio
 import unittest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import DEFAULT, AsyncMock, patch
 import custom_components.pajgps.pajgps_data as pajgps_data
 from custom_components.pajgps import models
+from custom_components.pajgps import requests as pajgps_requests
+from custom_components.pajgps.api import alerts as pajgps_alerts
+from custom_components.pajgps.api import sensors as pajgps_sensors
 from custom_components.pajgps.api.auth import get_login_token
 from custom_components.pajgps.api.positions import fetch_elevation
+from custom_components.pajgps.const import ALERT_TYPE_FIELDS, ALERT_TYPE_TO_DEVICE_FIELD
 from custom_components.pajgps.models import PajGPSAlert, PajGPSDevice, PajGPSPositionData
-from dotenv import load_dotenv
+from custom_components.pajgps.requests import ApiResponseError
 
-class PajGpsDataTest(unittest.IsolatedAsyncioTestCase):
+try:
+    # uvloop is optional; when installed the tests run on it like the benchmark does
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Alert types the devices can report and toggle
+_ALERT_TYPES = tuple(ALERT_TYPE_TO_DEVICE_FIELD)
+
+# Only look for a .env file when the credentials are not already in the environment
+if not os.environ.get('PAJGPS_EMAIL'):
+    from dotenv import load_dotenv
+    load_dotenv()
+_HAS_CREDS = bool(os.environ.get('PAJGPS_EMAIL') and os.environ.get('PAJGPS_PASSWORD'))
+
+
+def async_returning(value):
+    """Plain coroutine stub returning `value`, for patches that need no await assertions."""
+    async def _stub(*args, **kwargs):
+        return value
+    return _stub
+
+
+def async_raising(exc: BaseException):
+    """Plain coroutine stub raising `exc`, for patches that need no await assertions."""
+    async def _stub(*args, **kwargs):
+        raise exc
+    return _stub
+
+
+class _FakeResponse:
+    """Minimal stand-in for an aiohttp response with a JSON body."""
+
+    def __init__(self, status: int, payload: dict) -> None:
+        self.status = status
+        self.headers = {'Content-Type': 'application/json'}
+        self._payload = payload
+
+    async def json(self):
+        return self._payload
+
+
+class _FakeSession:
+    """
+    Stand-in for aiohttp.ClientSession used by the make_request tests.
+    Every get/post/put call counts as one attempt; the first `timeouts` attempts time out.
+    """
+
+    def __init__(self, response: _FakeResponse | None = None, timeouts: int = 0) -> None:
+        self.response = response
+        self.timeouts = timeouts
+        self.call_count = 0
+        self.closed = False
+
+    async def _request(self, *args, **kwargs):
+        self.call_count += 1
+        if self.call_count <= self.timeouts:
+            raise asyncio.TimeoutError("Simulated timeout")
+        return self.response
+
+    get = post = put = _request
+
+    async def close(self):
+        self.closed = True
+
+class _PajGpsDataTestCase(unittest.IsolatedAsyncioTestCase):
+    """
+    Shared fixture: a fresh PajGPSData singleton for every test case.
+    """
+
+    # Picked up by IsolatedAsyncioTestCase on Python 3.13+, without touching the global loop policy
+    loop_factory = staticmethod(uvloop.new_event_loop) if uvloop is not None else None
 
     data: pajgps_data.PajGPSData
+    email: str | None
+    password: str | None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        This function is called once before all test cases of the class.
+        """
+        cls.email = os.getenv('PAJGPS_EMAIL')
+        cls.password = os.getenv('PAJGPS_PASSWORD')
 
     async def asyncSetUp(self) -> None:
         """
         This function is called before each test case.
         """
-        load_dotenv()
-        email = os.getenv('PAJGPS_EMAIL')
-        password = os.getenv('PAJGPS_PASSWORD')
         entry_name = "test_entry"
         await pajgps_data.PajGPSData.clean_instances()
-        self.data = pajgps_data.PajGPSData.get_instance("test-guid", entry_name, email, password, False, False, False)
+        self.data = pajgps_data.PajGPSData.get_instance("test-guid", entry_name, self.email, self.password, False, False, False)
 
     async def asyncTearDown(self) -> None:
         """
@@ -33,27 +115,17 @@ class PajGpsDataTest(unittest.IsolatedAsyncioTestCase):
         await pajgps_data.PajGPSData.clean_instances()
 
 
-    async def test_login(self):
-        """
-        Test if credentials are set and if login token is valid.
-        """
-        assert self.data.email is not None
-        assert self.data.password is not None
-        if self.data.email is None or self.data.password is None:
-            return
-        # Test login with valid credentials
-        token = await get_login_token(self.data.email, self.data.password)
-        assert token is not None
-        # Test if login token is valid bearer header
-        if token is not None:
-            assert len(token) > 20
+class PajGpsDataTest(_PajGpsDataTestCase):
+    """
+    Tests that run without network access, against mocked requests.
+    """
 
     async def test_refresh_token(self):
         """
         Test the refresh_token method.
         """
         with patch('custom_components.pajgps.api.auth.refresh_token',
-                   new=AsyncMock(return_value=("new_token", time.time()))):
+                   new=async_returning(("new_token", time.time()))):
             self.data.token = None
             await self.data.refresh_token()
             assert self.data.token == "new_token"
@@ -62,16 +134,13 @@ class PajGpsDataTest(unittest.IsolatedAsyncioTestCase):
         """
         Test the async_update method.
         """
-        with (patch.object(self.data, 'refresh_token', new=AsyncMock()), \
-             patch.object(self.data, 'update_position_data', new=AsyncMock()), \
-             patch.object(self.data, 'update_alerts_data', new=AsyncMock()), \
-             patch.object(self.data, 'update_devices_data', new=AsyncMock())):
+        with patch.multiple(self.data, new_callable=AsyncMock, refresh_token=DEFAULT,
+                            update_position_data=DEFAULT, update_alerts_data=DEFAULT, update_devices_data=DEFAULT):
             self.data.token = "test_token"
             await self.data.refresh_token()
             await self.data.update_pajgps_data()
             assert self.data.last_update > 0
 
-
     def test_get_standard_headers(self):
         """
         Test the get_standard_headers method.
@@ -80,6 +149,20 @@ class PajGpsDataTest(unittest.IsolatedAsyncioTestCase):
         headers = self.data.get_standard_headers()
         assert headers["Authorization"] == "Bearer test_token"
         assert headers["accept"] == "application/json"
+        # Reused while the token stays the same, rebuilt once it changes
+        assert self.data.get_standard_headers() is headers
+        self.data.token = "other_token"
+        assert self.data.get_standard_headers()["Authorization"] == "Bearer other_token"
+
+    def test_models_use_slots(self):
+        """
+        Test that the models keep their attributes in slots instead of a per-instance dict.
+        """
+        position = PajGPSPositionData(1, 52.0, 13.0, 0, 0, 100)
+        assert position.elevation is None
+        assert position.last_elevation_update == 0.0
+        for instance in (PajGPSDevice(1), PajGPSAlert(1, 2), position, models.PajGPSSensorData(1)):
+            assert not hasattr(instance, '__dict__')
 
     async def test_refresh_token_skipped(self):
         """
@@ -112,6 +195,8 @@ class PajGpsDataTest(unittest.IsolatedAsyncioTestCase):
         assert data_1.entry_name != data_2.entry_name
         assert data_1.email != data_2.email
         assert data_1.password != data_2.password
+        assert data_1.unique_id_prefix == "pajgps_guid1_"
+        assert data_2.unique_id_prefix == "pajgps_guid2_"
 
     async def test_singleton(self):
         """
@@ -132,6 +217,328 @@ class PajGpsDataTest(unittest.IsolatedAsyncioTestCase):
         data_1.token = "should_be_same_token"
         assert data_2.token == "should_be_same_token"
 
+    def test_alert_type_fields_match_device(self):
+        """
+        Test that every alert type in the shared table names real PajGPSDevice attributes.
+        """
+        for alert_type, (has_attr, enabled_attr, _) in ALERT_TYPE_FIELDS.items():
+            with self.subTest(alert_type=alert_type):
+                assert has_attr in PajGPSDevice.__slots__
+                assert enabled_attr in PajGPSDevice.__slots__
+
+    async def test_change_alert_state_lookup(self):
+        """
+        Test that change_alert_state updates the device and sends one PUT for a known alert type,
+        and leaves both alone for an unknown one.
+        """
+        device = PajGPSDevice(1)
+        device.has_alarm_sos = True
+        device.alarm_sos_enabled = False
+
+        session = _FakeSession(_FakeResponse(200, {"success": "data"}))
+        await pajgps_alerts.change_alert_state(device, 999, True, {}, session=session)
+        assert session.call_count == 0
+        assert device.is_alert_enabled(4) == False
+
+        await pajgps_alerts.change_alert_state(device, 4, True, {}, session=session)
+        assert session.call_count == 1
+        assert device.is_alert_enabled(4) == True
+
+    def test_lookups_follow_replaced_lists(self):
+        """
+        Test that get_device, get_position and get_sensors see the lists assigned last.
+        """
+        self.data.devices = [PajGPSDevice(1), PajGPSDevice(2)]
+        self.data.positions = [PajGPSPositionData(2, 52.0, 13.0, 0, 0, 100)]
+        self.data.sensors = [models.PajGPSSensorData(1, 12.5)]
+        assert self.data.get_device(2) is self.data.devices[1]
+        assert self.data.get_position(2) is self.data.positions[0]
+        assert self.data.get_sensors(1).voltage == 12.5
+        assert self.data.get_position(1) is None
+
+        self.data.devices = [PajGPSDevice(3)]
+        assert self.data.get_device(1) is None
+        assert self.data.get_device(3) is self.data.devices[0]
+        self.data.clean_data()
+        assert self.data.get_device(3) is None
+        assert self.data.get_position(2) is None
+
+    async def test_sensor_requests_run_concurrently(self):
+        """
+        Test that fetch_sensors sends the per-device requests concurrently.
+        Each fake request waits until the other device's request has started,
+        so fetching them one after another would never finish.
+        """
+        started = {1: asyncio.Event(), 2: asyncio.Event()}
+
+        async def rendezvous(method, url, headers, **kwargs):
+            device_id = int(url.rsplit('/', 1)[1])
+            started[device_id].set()
+            await started[3 - device_id].wait()
+            return {"success": {"volt": device_id * 1000}}
+
+        with patch('custom_components.pajgps.api.sensors.make_request', new=rendezvous):
+            result = await asyncio.wait_for(
+                pajgps_sensors.fetch_sensors([PajGPSDevice(1), PajGPSDevice(2)], {}), timeout=1
+            )
+        assert [sensor.voltage for sensor in result] == [1.0, 2.0]
+
+    async def test_sensor_requests_bounded(self):
+        """
+        Test that fetch_sensors never has more than `concurrency` requests in flight.
+        """
+        in_flight = 0
+        peak = 0
+
+        async def counting_request(method, url, headers, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return {"success": {"volt": 1000}}
+
+        devices = [PajGPSDevice(device_id) for device_id in range(1, 6)]
+        with patch('custom_components.pajgps.api.sensors.make_request', new=counting_request):
+            result = await pajgps_sensors.fetch_sensors(devices, {}, concurrency=2)
+        assert len(result) == 5
+        assert peak == 2
+
+    async def test_api_error_handling(self):
+        """
+        Test that stale device data is preserved when an API error occurs.
+        """
+        # Pre-populate with some devices so we can verify they are NOT wiped
+        self.data.devices = [models.PajGPSDevice(1)]
+        with patch('custom_components.pajgps.api.devices.make_request',
+                         new=async_raising(ApiResponseError({"error": "Test error"}))):
+            await self.data.update_devices_data()
+            # Stale data should be preserved, not wiped
+            assert len(self.data.devices) == 1
+
+    async def test_timeout_handling(self):
+        """
+        Test that stale position data is preserved when a timeout occurs.
+        """
+        # Pre-populate with a position so we can verify it is NOT wiped
+        self.data.positions = [models.PajGPSPositionData(1, 52.0, 13.0, 0, 0, 100)]
+        with patch('custom_components.pajgps.api.positions.make_request',
+                         new=async_raising(TimeoutError())):
+            await self.data.update_position_data()
+            # Stale data should be preserved, not wiped
+            assert len(self.data.positions) == 1
+
+    async def test_elevation_update_not_scheduled_twice(self):
+        """
+        Test that a device whose elevation fetch is still running is not scheduled again.
+        """
+        self.data.fetch_elevation = True
+        self.data.devices = [models.PajGPSDevice(1)]
+        self.data.positions = [PajGPSPositionData(1, 52.0, 13.0, 0, 0, 100)]
+
+        async def moved_positions(*args, **kwargs):
+            return [PajGPSPositionData(1, 52.1, 13.1, 0, 0, 100)], {"success": []}
+
+        with patch('custom_components.pajgps.api.positions.fetch_positions',
+                   new=moved_positions), \
+             patch('custom_components.pajgps.api.positions.fetch_elevation',
+                   new=AsyncMock(return_value=100.0)) as fetch_elevation_mock:
+            # The second update runs before the first elevation task had a chance to start
+            await self.data.update_position_data()
+            await self.data.update_position_data()
+            assert len(self.data._background_tasks) == 1
+            await self.data.async_wait_idle()
+
+        fetch_elevation_mock.assert_awaited_once()
+        assert self.data.get_position(1).elevation == 100
+        assert not self.data._inflight_elevation
+
+    async def test_elevation_claim_released_on_early_cancel(self):
+        """
+        Test that an elevation task cancelled before it starts does not leave its device claimed.
+        """
+        self.data.fetch_elevation = True
+        self.data.devices = [models.PajGPSDevice(1)]
+        self.data.positions = [PajGPSPositionData(1, 52.0, 13.0, 0, 0, 100)]
+
+        async def moved_positions(*args, **kwargs):
+            return [PajGPSPositionData(1, 52.1, 13.1, 0, 0, 100)], {"success": []}
+
+        with patch('custom_components.pajgps.api.positions.fetch_positions',
+                   new=moved_positions), \
+             patch('custom_components.pajgps.api.positions.fetch_elevation',
+                   new=AsyncMock(return_value=100.0)) as fetch_elevation_mock:
+            await self.data.update_position_data()
+            for task in self.data._background_tasks:
+                task.cancel()
+            await self.data.async_wait_idle()
+
+        fetch_elevation_mock.assert_not_awaited()
+        assert not self.data._inflight_elevation
+
+    async def test_get_request_retry_on_timeout(self):
+        """
+        Test that make_request retries up to 3 times on timeout for GET requests.
+        """
+        session = _FakeSession(_FakeResponse(200, {"success": "data"}), timeouts=2)
+        with patch.object(pajgps_requests.aiohttp, 'ClientSession', return_value=session):
+            result = await pajgps_requests.make_request(
+                method="GET",
+                url="http://test.com",
+                headers={},
+                timeout=1,
+                max_attempts=3
+            )
+        assert session.call_count == 3, f"Expected 3 attempts, but got {session.call_count}"
+        assert result == {"success": "data"}
+        print(f"✓ GET request succeeded after {session.call_count} attempts (2 timeouts, 1 success)")
+
+    async def test_get_request_fails_after_max_retries(self):
+        """
+        Test that make_request fails after 3 timeout attempts for GET requests.
+        """
+        session = _FakeSession(timeouts=3)
+        with patch.object(pajgps_requests.aiohttp, 'ClientSession', return_value=session):
+            with self.assertRaises(asyncio.TimeoutError):
+                await pajgps_requests.make_request(
+                    method="GET",
+                    url="http://test.com",
+                    headers={},
+                    timeout=1,
+                    max_attempts=3
+                )
+
+        assert session.call_count == 3, f"Expected 3 attempts, but got {session.call_count}"
+        print(f"✓ GET request properly failed after {session.call_count} timeout attempts")
+
+    async def test_post_request_retry_on_timeout(self):
+        """
+        Test that make_request retries up to 3 times on timeout for POST requests.
+        """
+        session = _FakeSession(_FakeResponse(200, {"success": "posted"}), timeouts=1)
+        with patch.object(pajgps_requests.aiohttp, 'ClientSession', return_value=session):
+            result = await pajgps_requests.make_request(
+                method="POST",
+                url="http://test.com",
+                headers={},
+                payload={"data": "test"},
+                timeout=1,
+                max_attempts=3
+            )
+        assert session.call_count == 2, f"Expected 2 attempts, but got {session.call_count}"
+        assert result == {"success": "posted"}
+        print(f"✓ POST request succeeded after {session.call_count} attempts (1 timeout, 1 success)")
+
+    async def test_put_request_retry_on_timeout(self):
+        """
+        Test that make_request retries up to 3 times on timeout for PUT requests.
+        """
+        session = _FakeSession(_FakeResponse(200, {"success": "updated"}), timeouts=1)
+        with patch.object(pajgps_requests.aiohttp, 'ClientSession', return_value=session):
+            result = await pajgps_requests.make_request(
+                method="PUT",
+                url="http://test.com",
+                headers={},
+                timeout=1,
+                max_attempts=3
+            )
+        assert session.call_count == 2, f"Expected 2 attempts, but got {session.call_count}"
+        assert result == {"success": "updated"}
+        print(f"✓ PUT request succeeded after {session.call_count} attempts (1 timeout, 1 success)")
+
+    async def test_non_timeout_errors_not_retried(self):
+        """
+        Test that non-timeout errors are not retried.
+        """
+        session = _FakeSession(_FakeResponse(400, {"error": "Bad request"}))
+        with patch.object(pajgps_requests.aiohttp, 'ClientSession', return_value=session):
+            with self.assertRaises(Exception):  # Will raise exception due to 400 status
+                await pajgps_requests.make_request(
+                    method="GET",
+                    url="http://test.com",
+                    headers={},
+                    timeout=1,
+                    max_attempts=3
+                )
+
+        assert session.call_count == 1, f"Expected 1 attempt for non-timeout error, but got {session.call_count}"
+        print(f"✓ Non-timeout error properly failed immediately without retry")
+
+    async def test_api_error_keeps_status(self):
+        """
+        Test that a JSON error body raises ApiResponseError carrying the HTTP status in its message.
+        """
+        session = _FakeSession(_FakeResponse(429, {"error": "Too many requests"}))
+        with self.assertRaises(ApiResponseError) as ctx:
+            await pajgps_requests.make_request(
+                method="GET",
+                url="http://test.com",
+                headers={},
+                session=session,
+            )
+
+        assert ctx.exception.status == 429
+        assert "status 429" in str(ctx.exception)
+
+    async def test_shared_session_reused_and_not_closed(self):
+        """
+        Test that make_request uses a caller-supplied session for every attempt and leaves it open.
+        """
+        session = _FakeSession(_FakeResponse(200, {"success": "data"}), timeouts=1)
+        result = await pajgps_requests.make_request(
+            method="GET",
+            url="http://test.com",
+            headers={},
+            timeout=1,
+            max_attempts=3,
+            session=session
+        )
+        assert result == {"success": "data"}
+        assert session.call_count == 2, f"Expected 2 attempts on the shared session, but got {session.call_count}"
+        assert not session.closed, "Shared session must not be closed by make_request"
+
+
+@unittest.skipUnless(_HAS_CREDS, "PAJGPS_EMAIL and PAJGPS_PASSWORD not set")
+class PajGpsDataApiTest(_PajGpsDataTestCase):
+    """
+    Integration tests against the real PajGPS API, skipped when no credentials are configured.
+    """
+
+    token: str | None
+    token_time: float
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """
+        Log in once for the whole class; every test starts with this token instead of its own login.
+        """
+        super().setUpClass()
+        cls.token = asyncio.run(get_login_token(cls.email, cls.password))
+        cls.token_time = time.time()
+
+    async def asyncSetUp(self) -> None:
+        """
+        This function is called before each test case.
+        """
+        await super().asyncSetUp()
+        self.data.token = self.token
+        self.data.last_token_update = self.token_time
+
+    async def test_login(self):
+        """
+        Test if credentials are set and if login token is valid.
+        """
+        assert self.data.email is not None
+        assert self.data.password is not None
+        if self.data.email is None or self.data.password is None:
+            return
+        # Test login with valid credentials
+        token = await get_login_token(self.data.email, self.data.password)
+        assert token is not None
+        # Test if login token is valid bearer header
+        if token is not None:
+            assert len(token) > 20
+
     async def test_update_data(self):
         """
         Test the update_position_data method.
@@ -159,7 +566,7 @@ class PajGpsDataTest(unittest.IsolatedAsyncioTestCase):
             assert pos.battery_level is not None
 
         # Mock the make_request to test the update_alerts_data method without data from api
-        with patch('custom_components.pajgps.api.alerts.make_request', new=AsyncMock(return_value={"success": [
+        with patch('custom_components.pajgps.api.alerts.make_request', new=async_returning({"success": [
                 {
                   "id": 1,
                   "iddevice": 1,
@@ -230,7 +637,7 @@ class PajGpsDataTest(unittest.IsolatedAsyncioTestCase):
             assert isinstance(alert, PajGPSAlert)
             assert alert.device_id is not None
             assert alert.alert_type is not None
-            assert alert.alert_type in [1, 2, 4, 5, 6, 7, 9, 13]  # Valid alert types
+            assert alert.alert_type in _ALERT_TYPES
 
     async def test_get_alerts_by_device(self):
         """
@@ -265,11 +672,11 @@ class PajGpsDataTest(unittest.IsolatedAsyncioTestCase):
         device = self.data.devices[0]
 
         # Test all alert types
-        alert_types = [1, 2, 4, 5, 6, 7, 9, 13]
-        for alert_type in alert_types:
-            # Should return boolean without throwing error
-            result = device.is_alert_enabled(alert_type)
-            assert isinstance(result, bool)
+        for alert_type in _ALERT_TYPES:
+            with self.subTest(alert_type=alert_type):
+                # Should return boolean without throwing error
+                result = device.is_alert_enabled(alert_type)
+                assert isinstance(result, bool)
 
         # Test invalid alert type
         result = device.is_alert_enabled(999)
@@ -380,32 +787,6 @@ class PajGpsDataTest(unittest.IsolatedAsyncioTestCase):
         assert len(self.data.positions) == 0
         assert len(self.data.alerts) == 0
 
-    async def test_api_error_handling(self):
-        """
-        Test that stale device data is preserved when an API error occurs.
-        """
-        from custom_components.pajgps.requests import ApiResponseError
-        # Pre-populate with some devices so we can verify they are NOT wiped
-        self.data.devices = [models.PajGPSDevice(1)]
-        with patch('custom_components.pajgps.api.devices.make_request',
-                         new=AsyncMock(side_effect=ApiResponseError({"error": "Test error"}))):
-            await self.data.update_devices_data()
-            # Stale data should be preserved, not wiped
-            assert len(self.data.devices) == 1
-
-    async def test_timeout_handling(self):
-        """
-        Test that stale position data is preserved when a timeout occurs.
-        """
-        # Pre-populate with a position so we can verify it is NOT wiped
-        self.data.positions = [models.PajGPSPositionData(1, 52.0, 13.0, 0, 0, 100)]
-        with patch('custom_components.pajgps.api.positions.make_request',
-                         new=AsyncMock(side_effect=TimeoutError())):
-            await self.data.update_position_data()
-            # Stale data should be preserved, not wiped
-            assert len(self.data.positions) == 1
-
-
     async def test_background_tasks_tracking(self):
         """
         Test that background tasks are properly tracked.
@@ -417,15 +798,14 @@ class PajGpsDataTest(unittest.IsolatedAsyncioTestCase):
         self.data.mark_alerts_as_read = True
 
         with patch('custom_components.pajgps.api.alerts.make_request',
-                         new=AsyncMock(return_value={"success": [{"iddevice": 1, "meldungtyp": 2}]})):
+                         new=async_returning({"success": [{"iddevice": 1, "meldungtyp": 2}]})):
                 await self.data.update_alerts_data()
 
-                # Give background tasks a moment to start
-                await asyncio.sleep(0.1)
+                # Marking the alerts as read is scheduled, not awaited
+                assert len(self.data._background_tasks) == 1
 
-                # Background tasks should complete quickly
-                if self.data._background_tasks:
-                    await asyncio.gather(*self.data._background_tasks, return_exceptions=True)
+                # Waiting on the tasks also runs their done callbacks, no sleep needed
+                await self.data.async_wait_idle()
 
                 # After completion, background tasks should be cleaned up
                 assert len(self.data._background_tasks) == 0
@@ -534,21 +914,26 @@ class PajGpsDataTest(unittest.IsolatedAsyncioTestCase):
         original_update_devices = self.data.update_devices_data
         update_devices_call_count = 0
 
+        # The first update signals once it holds the lock and then stays there until released
+        started = asyncio.Event()
+        release = asyncio.Event()
+
         async def slow_update_devices():
-            """Simulate slow API response by adding delay"""
+            """Simulate slow API response by waiting until the test releases it"""
             nonlocal update_devices_call_count
             update_devices_call_count += 1
-            await asyncio.sleep(2)  # Simulate slow API
+            started.set()
+            await release.wait()
             await original_update_devices()
 
         # Patch the update method to be slow
         self.data.update_devices_data = slow_update_devices
 
-        # Start first update (will take ~2 seconds)
+        # Start first update (blocks inside the lock until released)
         first_update_task = asyncio.create_task(self.data.update_pajgps_data(forced=True))
 
-        # Wait a bit to ensure first update has acquired the lock
-        await asyncio.sleep(0.1)
+        # Wait until the first update has acquired the lock
+        await started.wait()
 
         # Try to start second update while first is still running
         # This should be skipped because lock is held
@@ -560,7 +945,8 @@ class PajGpsDataTest(unittest.IsolatedAsyncioTestCase):
         assert second_update_duration < 0.5, \
             f"Second update took {second_update_duration:.2f}s, should have been skipped immediately"
 
-        # Wait for first update to complete
+        # Let the first update finish
+        release.set()
         await first_update_task
 
         # Verify that update_devices was only called once (from first update)
@@ -569,250 +955,3 @@ class PajGpsDataTest(unittest.IsolatedAsyncioTestCase):
 
         print(f"✓ Second update was properly skipped (returned in {second_update_duration:.3f}s)")
         print(f"✓ Only {update_devices_call_count} actual update was performed")
-
-    async def test_get_request_retry_on_timeout(self):
-        """
-        Test that make_request retries up to 3 times on timeout for GET requests.
-        """
-        from custom_components.pajgps import requests as pajgps_requests
-
-        call_count = [0]
-
-        class MockResponse:
-            def __init__(self):
-                self.status = 200
-                self.headers = {'Content-Type': 'application/json'}
-
-            async def json(self):
-                return {"success": "data"}
-
-        class MockSession:
-            def __init__(self, call_count):
-                self.call_count = call_count
-                self.closed = False
-
-            async def get(self, *args, **kwargs):
-                self.call_count[0] += 1
-                if self.call_count[0] < 3:
-                    raise asyncio.TimeoutError("Simulated timeout")
-                return MockResponse()
-
-            async def close(self):
-                self.closed = True
-
-        original_client_session = pajgps_requests.aiohttp.ClientSession
-
-        def mock_client_session(*args, **kwargs):
-            return MockSession(call_count)
-
-        pajgps_requests.aiohttp.ClientSession = mock_client_session
-
-        try:
-            result = await pajgps_requests.make_request(
-                method="GET",
-                url="http://test.com",
-                headers={},
-                timeout=1,
-                max_attempts=3
-            )
-            assert call_count[0] == 3, f"Expected 3 attempts, but got {call_count[0]}"
-            assert result == {"success": "data"}
-            print(f"✓ GET request succeeded after {call_count[0]} attempts (2 timeouts, 1 success)")
-        finally:
-            pajgps_requests.aiohttp.ClientSession = original_client_session
-
-    async def test_get_request_fails_after_max_retries(self):
-        """
-        Test that make_request fails after 3 timeout attempts for GET requests.
-        """
-        from custom_components.pajgps import requests as pajgps_requests
-
-        call_count = [0]
-
-        class MockSession:
-            def __init__(self, call_count):
-                self.call_count = call_count
-                self.closed = False
-
-            async def get(self, *args, **kwargs):
-                self.call_count[0] += 1
-                raise asyncio.TimeoutError("Simulated timeout")
-
-            async def close(self):
-                self.closed = True
-
-        original_client_session = pajgps_requests.aiohttp.ClientSession
-
-        def mock_client_session(*args, **kwargs):
-            return MockSession(call_count)
-
-        pajgps_requests.aiohttp.ClientSession = mock_client_session
-
-        try:
-            with self.assertRaises(asyncio.TimeoutError):
-                await pajgps_requests.make_request(
-                    method="GET",
-                    url="http://test.com",
-                    headers={},
-                    timeout=1,
-                    max_attempts=3
-                )
-
-            assert call_count[0] == 3, f"Expected 3 attempts, but got {call_count[0]}"
-            print(f"✓ GET request properly failed after {call_count[0]} timeout attempts")
-        finally:
-            pajgps_requests.aiohttp.ClientSession = original_client_session
-
-    async def test_post_request_retry_on_timeout(self):
-        """
-        Test that make_request retries up to 3 times on timeout for POST requests.
-        """
-        from custom_components.pajgps import requests as pajgps_requests
-
-        call_count = [0]
-
-        class MockResponse:
-            def __init__(self):
-                self.status = 200
-                self.headers = {'Content-Type': 'application/json'}
-
-            async def json(self):
-                return {"success": "posted"}
-
-        class MockSession:
-            def __init__(self, call_count):
-                self.call_count = call_count
-                self.closed = False
-
-            async def post(self, *args, **kwargs):
-                self.call_count[0] += 1
-                if self.call_count[0] < 2:
-                    raise asyncio.TimeoutError("Simulated timeout")
-                return MockResponse()
-
-            async def close(self):
-                self.closed = True
-
-        original_client_session = pajgps_requests.aiohttp.ClientSession
-
-        def mock_client_session(*args, **kwargs):
-            return MockSession(call_count)
-
-        pajgps_requests.aiohttp.ClientSession = mock_client_session
-
-        try:
-            result = await pajgps_requests.make_request(
-                method="POST",
-                url="http://test.com",
-                headers={},
-                payload={"data": "test"},
-                timeout=1,
-                max_attempts=3
-            )
-            assert call_count[0] == 2, f"Expected 2 attempts, but got {call_count[0]}"
-            assert result == {"success": "posted"}
-            print(f"✓ POST request succeeded after {call_count[0]} attempts (1 timeout, 1 success)")
-        finally:
-            pajgps_requests.aiohttp.ClientSession = original_client_session
-
-    async def test_put_request_retry_on_timeout(self):
-        """
-        Test that make_request retries up to 3 times on timeout for PUT requests.
-        """
-        from custom_components.pajgps import requests as pajgps_requests
-
-        call_count = [0]
-
-        class MockResponse:
-            def __init__(self):
-                self.status = 200
-                self.headers = {'Content-Type': 'application/json'}
-
-            async def json(self):
-                return {"success": "updated"}
-
-        class MockSession:
-            def __init__(self, call_count):
-                self.call_count = call_count
-                self.closed = False
-
-            async def put(self, *args, **kwargs):
-                self.call_count[0] += 1
-                if self.call_count[0] < 2:
-                    raise asyncio.TimeoutError("Simulated timeout")
-                return MockResponse()
-
-            async def close(self):
-                self.closed = True
-
-        original_client_session = pajgps_requests.aiohttp.ClientSession
-
-        def mock_client_session(*args, **kwargs):
-            return MockSession(call_count)
-
-        pajgps_requests.aiohttp.ClientSession = mock_client_session
-
-        try:
-            result = await pajgps_requests.make_request(
-                method="PUT",
-                url="http://test.com",
-                headers={},
-                timeout=1,
-                max_attempts=3
-            )
-            assert call_count[0] == 2, f"Expected 2 attempts, but got {call_count[0]}"
-            assert result == {"success": "updated"}
-            print(f"✓ PUT request succeeded after {call_count[0]} attempts (1 timeout, 1 success)")
-        finally:
-            pajgps_requests.aiohttp.ClientSession = original_client_session
-
-    async def test_non_timeout_errors_not_retried(self):
-        """
-        Test that non-timeout errors are not retried.
-        """
-        from custom_components.pajgps import requests as pajgps_requests
-
-        call_count = [0]
-
-        class MockResponse:
-            def __init__(self):
-                self.status = 400
-                self.headers = {'Content-Type': 'application/json'}
-
-            async def json(self):
-                return {"error": "Bad request"}
-
-        class MockSession:
-            def __init__(self, call_count):
-                self.call_count = call_count
-                self.closed = False
-
-            async def get(self, *args, **kwargs):
-                self.call_count[0] += 1
-                return MockResponse()
-
-            async def close(self):
-                self.closed = True
-
-        original_client_session = pajgps_requests.aiohttp.ClientSession
-
-        def mock_client_session(*args, **kwargs):
-            return MockSession(call_count)
-
-        pajgps_requests.aiohttp.ClientSession = mock_client_session
-
-        try:
-            with self.assertRaises(Exception):  # Will raise exception due to 400 status
-                await pajgps_requests.make_request(
-                    method="GET",
-                    url="http://test.com",
-                    headers={},
-                    timeout=1,
-                    max_attempts=3
-                )
-
-            assert call_count[0] == 1, f"Expected 1 attempt for non-timeout error, but got {call_count[0]}"
-            print(f"✓ Non-timeout error properly failed immediately without retry")
-        finally:
-            pajgps_requests.aiohttp.ClientSession = original_client_session
-